@@ -0,0 +1,7 @@
+"""Compatibility shims for older Python versions."""
+
+import sys
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters get a regular dataclass
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
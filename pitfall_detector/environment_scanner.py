@@ -7,18 +7,65 @@ import subprocess
 import json
 import re
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Set, Tuple
-import pkg_resources
+import importlib.metadata as importlib_metadata
 import psutil
-from .static_rules import KNOWN_AI_TOOLS
+from . import static_rules
 from .dynamic_agent_detector import DynamicAgentDetector
 
 
+# One `docker ps --format '{{.Names}}\t{{.Image}}\t{{.Ports}}'` row; ports may be empty
+_DOCKER_PS_RX = re.compile(r'^([^\t\n]+)\t([^\t\n]+)\t([^\t\n]*)', re.MULTILINE)
+
+# Known AI tool ports probed by _scan_running_services. 8501 has always been
+# reported under its later 'streamlit_alternative' label.
+_SERVICE_PORTS = MappingProxyType({
+    8501: 'streamlit_alternative',
+    7860: 'gradio',
+    8888: 'jupyter',
+    8000: 'fastapi',
+    5000: 'flask',
+    3000: 'nodejs',
+    8080: 'generic_web',
+    9000: 'mlflow',
+    6006: 'tensorboard',
+})
+
+
+# Known AI tool environment variables read by _scan_environment_variables
+_AI_ENV_VARS = (
+    'OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'COHERE_API_KEY',
+    'HUGGINGFACE_API_TOKEN', 'REPLICATE_API_TOKEN',
+    'LANGCHAIN_API_KEY', 'LANGSMITH_API_KEY',
+    'STREAMLIT_SERVER_PORT', 'GRADIO_SERVER_PORT',
+    'JUPYTER_PORT', 'MLFLOW_TRACKING_URI',
+    'WANDB_API_KEY', 'NEPTUNE_API_TOKEN'
+)
+_SECRET_ENV_VARS = frozenset(
+    var for var in _AI_ENV_VARS if 'api_key' in var.lower() or 'token' in var.lower()
+)
+_MASK_PREFIX_LEN = 8
+_MASK_SUFFIX_LEN = 4
+
+
+def _mask_secret(value: str) -> str:
+    """Keep only the ends of a secret; short values are hidden entirely."""
+    if len(value) > _MASK_PREFIX_LEN + _MASK_SUFFIX_LEN:
+        return value[:_MASK_PREFIX_LEN] + "..." + value[-_MASK_SUFFIX_LEN:]
+    return "***"
+
+
+def _normalize_package_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503)."""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
 class EnvironmentScanner:
     """Scans the current environment for installed AI tools and services."""
     
     def __init__(self):
-        self.known_tools = KNOWN_AI_TOOLS
+        self.known_tools = static_rules.KNOWN_AI_TOOLS
         self.detected_tools = {}
         
     def scan_all(self, project_path: Optional[str] = None) -> Dict[str, any]:
@@ -57,19 +104,23 @@ class EnvironmentScanner:
         detected = {}
         
         try:
-            # Get all installed packages
-            installed_packages = {pkg.project_name.lower(): pkg for pkg in pkg_resources.working_set}
+            # Get all installed packages; the first one on sys.path wins, as on import
+            installed_packages = {}
+            for dist in importlib_metadata.distributions():
+                name = dist.metadata['Name']
+                if name:
+                    installed_packages.setdefault(_normalize_package_name(name), dist)
             
             for tool_name, tool_info in self.known_tools.items():
                 # Check if any known package names match
                 package_names = tool_info.get('package_names', [tool_name])
                 for pkg_name in package_names:
-                    if pkg_name.lower() in installed_packages:
-                        pkg = installed_packages[pkg_name.lower()]
+                    dist = installed_packages.get(_normalize_package_name(pkg_name))
+                    if dist is not None:
                         detected[tool_name] = {
-                            'package_name': pkg.project_name,
-                            'version': pkg.version,
-                            'location': pkg.location,
+                            'package_name': dist.metadata['Name'],
+                            'version': dist.version,
+                            'location': str(dist.locate_file('')),
                             'detection_method': 'pip_installed',
                             'tool_info': tool_info
                         }
@@ -84,21 +135,7 @@ class EnvironmentScanner:
         """Scan for running services on known AI tool ports."""
         detected = {}
         
-        # Known AI tool ports
-        known_ports = {
-            8501: 'streamlit',
-            7860: 'gradio', 
-            8888: 'jupyter',
-            8000: 'fastapi',
-            5000: 'flask',
-            3000: 'nodejs',
-            8080: 'generic_web',
-            9000: 'mlflow',
-            6006: 'tensorboard',
-            8501: 'streamlit_alternative'
-        }
-        
-        for port, service_name in known_ports.items():
+        for port, service_name in _SERVICE_PORTS.items():
             if self._is_port_in_use(port):
                 try:
                     # Try to get process info for the port
@@ -166,23 +203,20 @@ class EnvironmentScanner:
                                   capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split('\t')
-                        if len(parts) >= 3:
-                            name, image, ports = parts[0], parts[1], parts[2]
-                            
-                            # Check if image contains known AI tools
-                            for tool_name in self.known_tools.keys():
-                                if tool_name in image.lower() or tool_name in name.lower():
-                                    detected[f"docker_{name}"] = {
-                                        'container_name': name,
-                                        'image': image,
-                                        'ports': ports,
-                                        'tool': tool_name,
-                                        'detection_method': 'docker_container',
-                                        'status': 'running'
-                                    }
+                for name, image, ports in _DOCKER_PS_RX.findall(result.stdout):
+                    image_lower, name_lower = image.lower(), name.lower()
+                    
+                    # Check if image contains known AI tools
+                    for tool_name in self.known_tools.keys():
+                        if tool_name in image_lower or tool_name in name_lower:
+                            detected[f"docker_{name}"] = {
+                                'container_name': name,
+                                'image': image,
+                                'ports': ports,
+                                'tool': tool_name,
+                                'detection_method': 'docker_container',
+                                'status': 'running'
+                            }
                                     
         except (subprocess.TimeoutExpired, FileNotFoundError):
             # Docker not available
@@ -245,25 +279,10 @@ class EnvironmentScanner:
         """Scan environment variables for AI tool API keys and configurations."""
         detected = {}
         
-        # Known AI tool environment variables
-        ai_env_vars = [
-            'OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'COHERE_API_KEY',
-            'HUGGINGFACE_API_TOKEN', 'REPLICATE_API_TOKEN',
-            'LANGCHAIN_API_KEY', 'LANGSMITH_API_KEY',
-            'STREAMLIT_SERVER_PORT', 'GRADIO_SERVER_PORT',
-            'JUPYTER_PORT', 'MLFLOW_TRACKING_URI',
-            'WANDB_API_KEY', 'NEPTUNE_API_TOKEN'
-        ]
-        
-        for var in ai_env_vars:
+        for var in _AI_ENV_VARS:
             value = os.getenv(var)
             if value:
-                # Mask sensitive values
-                if 'api_key' in var.lower() or 'token' in var.lower():
-                    masked = value[:8] + "..." + value[-4:] if len(value) > 12 else "***"
-                    detected[var] = masked
-                else:
-                    detected[var] = value
+                detected[var] = _mask_secret(value) if var in _SECRET_ENV_VARS else value
                     
         return detected
     
@@ -487,7 +506,7 @@ class EnvironmentScanner:
         """Parse requirements.txt for AI tools."""
         detected = {}
         try:
-            with open(file_path, 'r') as f:
+            with file_path.open('r') as f:
                 for line in f:
                     line = line.strip()
                     if line and not line.startswith('#'):
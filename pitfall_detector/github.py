@@ -1,12 +1,38 @@
 """GitHub API integration for fetching tool documentation."""
 
+import base64
 import re
 import requests
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from .config import config
 
 
+# Handle different URL formats
+_GITHUB_URL_PATTERNS = [
+    re.compile(r'github\.com/([^/]+)/([^/]+)'),  # Standard format
+    re.compile(r'github\.com/([^/]+)/([^/]+)\.git'),  # Git clone format
+]
+
+
+@lru_cache(maxsize=1024)
+def _parse_github_url_cached(url: str) -> Optional[Tuple[str, str]]:
+    """Parse a GitHub URL into (owner, repo); results are cached per URL."""
+    # Clean up the URL
+    url = url.strip().rstrip('/')
+    
+    for pattern in _GITHUB_URL_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            owner, repo = match.groups()
+            # Remove .git suffix if present
+            repo = repo.replace('.git', '')
+            return owner, repo
+    
+    return None
+
+
 class GitHubClient:
     """Client for interacting with GitHub API to fetch tool documentation."""
     
@@ -38,24 +64,7 @@ class GitHubClient:
         Returns:
             Tuple of (owner, repo) or None if invalid
         """
-        # Clean up the URL
-        url = url.strip().rstrip('/')
-        
-        # Handle different URL formats
-        patterns = [
-            r'github\.com/([^/]+)/([^/]+)',  # Standard format
-            r'github\.com/([^/]+)/([^/]+)\.git',  # Git clone format
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                owner, repo = match.groups()
-                # Remove .git suffix if present
-                repo = repo.replace('.git', '')
-                return owner, repo
-        
-        return None
+        return _parse_github_url_cached(url)
     
     def get_readme(self, owner: str, repo: str) -> Optional[str]:
         """
@@ -82,7 +91,6 @@ class GitHubClient:
                     
                     # GitHub API returns base64 encoded content
                     if content_data.get('encoding') == 'base64':
-                        import base64
                         content = base64.b64decode(content_data['content']).decode('utf-8')
                         return content
                     else:
@@ -161,9 +169,40 @@ class GitHubClient:
             return False, str(e)
 
 
+# README keywords that put a tool in each category, in reporting order
+CATEGORY_KEYWORDS = {
+    'agent-framework': ['agent', 'multi-agent', 'crew'],
+    'llm-interface': ['llm', 'language model', 'gpt', 'claude'],
+    'rag-tool': ['rag', 'retrieval', 'vector', 'embedding'],
+    'memory-management': ['memory', 'context', 'conversation'],
+    'web-interface': ['streamlit', 'gradio', 'web', 'ui'],
+}
+
+
+def _build_category_rx(category_keywords: Dict[str, List[str]]) -> re.Pattern:
+    """Compile one pattern with a named group per category.
+    
+    The alternation sits inside a lookahead so every match is zero-width and
+    keywords starting at different positions ('rag' and 'agent' in 'ragent')
+    are all found. Only one category is reported per position, so a keyword
+    must not be a prefix of another category's keyword.
+    """
+    groups = (
+        f"(?P<{category.replace('-', '_')}>{'|'.join(map(re.escape, words))})"
+        for category, words in category_keywords.items()
+    )
+    return re.compile(f"(?=(?:{'|'.join(groups)}))")
+
+
 class ToolExtractor:
     """Extract tool information from GitHub repositories."""
     
+    CATEGORY_RX = _build_category_rx(CATEGORY_KEYWORDS)
+    # (regex group name, category) pairs in reporting order
+    _CATEGORY_GROUPS = tuple(
+        (category.replace('-', '_'), category) for category in CATEGORY_KEYWORDS
+    )
+    
     def __init__(self, github_client: GitHubClient):
         self.github = github_client
     
@@ -266,18 +305,14 @@ class ToolExtractor:
                 if match not in metadata['environment_vars']:
                     metadata['environment_vars'].append(match)
         
-        # Categorize tool type
-        content_lower = readme_content.lower()
-        
-        if any(word in content_lower for word in ['agent', 'multi-agent', 'crew']):
-            metadata['categories'].append('agent-framework')
-        if any(word in content_lower for word in ['llm', 'language model', 'gpt', 'claude']):
-            metadata['categories'].append('llm-interface')
-        if any(word in content_lower for word in ['rag', 'retrieval', 'vector', 'embedding']):
-            metadata['categories'].append('rag-tool')
-        if any(word in content_lower for word in ['memory', 'context', 'conversation']):
-            metadata['categories'].append('memory-management')
-        if any(word in content_lower for word in ['streamlit', 'gradio', 'web', 'ui']):
-            metadata['categories'].append('web-interface')
+        # Categorize tool type in a single pass over the README
+        found = set()
+        for match in self.CATEGORY_RX.finditer(readme_content.lower()):
+            found.add(match.lastgroup)
+            if len(found) == len(self._CATEGORY_GROUPS):
+                break
+        metadata['categories'] = [
+            category for group, category in self._CATEGORY_GROUPS if group in found
+        ]
         
         return metadata
\ No newline at end of file
@@ -165,23 +165,24 @@ class InteractiveWorkflow:
         """Steps 4-6: Interactive confirmation and supplementation loop."""
         self._show_progress("Confirming Detection Results")
         
-        # First, save detected tools to config
-        for tool in detected_tools:
-            tool_info = {
-                'display_name': tool.get('name', 'Unknown'),
-                'detection_method': ', '.join(tool.get('detection_methods', [])),
-                'added_manually': False,
-                'metadata': {
-                    'status': tool.get('status'),
-                    'versions': tool.get('versions', []),
-                    'confidence_score': tool.get('confidence_score')
+        # First, save detected tools to config (written once at the end)
+        with self.config_manager.batch():
+            for tool in detected_tools:
+                tool_info = {
+                    'display_name': tool.get('name', 'Unknown'),
+                    'detection_method': ', '.join(tool.get('detection_methods', [])),
+                    'added_manually': False,
+                    'metadata': {
+                        'status': tool.get('status'),
+                        'versions': tool.get('versions', []),
+                        'confidence_score': tool.get('confidence_score')
+                    }
                 }
-            }
-            self.config_manager.add_installed_tool(
-                self.project_path, 
-                tool.get('name', 'unknown'), 
-                tool_info
-            )
+                self.config_manager.add_installed_tool(
+                    self.project_path, 
+                    tool.get('name', 'unknown'), 
+                    tool_info
+                )
         
         confirmed_tools = detected_tools.copy()
         
@@ -1,62 +1,26 @@
 """Static rules for AI tool conflict detection - Database-driven version."""
 
-from typing import Dict, List, Set
+import re
+import sys
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Iterable, List, NamedTuple, Set, Tuple
+from ._compat import DATACLASS_SLOTS
 from .tools_database_loader import get_tools_database
 
 
-# Load tools from the external database
-def _load_known_tools() -> Dict[str, Dict]:
-    """Load known AI tools from the external database."""
-    try:
-        db = get_tools_database()
-        return db.get_all_tools()
-    except Exception as e:
-        print(f"Warning: Failed to load tools database: {e}")
-        return {}
+# Shared read-only defaults for missing tool metadata
+_EMPTY_DICT: Dict = {}
+_EMPTY_TUPLE: tuple = ()
 
 
-# Known AI tools - loaded from external database  
-KNOWN_AI_TOOLS = _load_known_tools()
-
-# Load port and environment conflicts from database
-def _load_conflict_data():
-    """Load conflict data from database."""
-    try:
-        db = get_tools_database()
-        return {
-            'port_conflicts': db.get_port_conflicts(),
-            'env_conflicts': db.get_env_conflicts(),
-            'conflict_patterns': db.get_conflict_patterns()
-        }
-    except Exception as e:
-        print(f"Warning: Failed to load conflict data: {e}")
-        return {'port_conflicts': {}, 'env_conflicts': {}, 'conflict_patterns': {}}
-
-# Load conflict data
-_conflict_data = _load_conflict_data()
-
-# Known default ports for popular AI tools - from database
-KNOWN_TOOL_PORTS = {}
-for tool_name, tool_info in KNOWN_AI_TOOLS.items():
-    ports = tool_info.get('default_ports', [])
-    if ports:
-        KNOWN_TOOL_PORTS[tool_name] = ports
-
-# Known environment variable conflicts - from database
-KNOWN_ENV_CONFLICTS = {}
-tools_by_env = {}
-for tool_name, tool_info in KNOWN_AI_TOOLS.items():
-    env_vars = tool_info.get('common_env_vars', [])
-    for env_var in env_vars:
-        if env_var not in tools_by_env:
-            tools_by_env[env_var] = []
-        tools_by_env[env_var].append(tool_name)
-
-# Only include env vars used by multiple tools (potential conflicts)
-KNOWN_ENV_CONFLICTS = {
-    env_var: tools for env_var, tools in tools_by_env.items()
-    if len(tools) > 1
-}
+# Known AI tools and the rule tables derived from them are built from the
+# external database on first use, see _load_rule_tables() and __getattr__().
+_RULE_TABLE_NAMES = frozenset({
+    'KNOWN_AI_TOOLS', 'KNOWN_TOOL_PORTS', 'KNOWN_ENV_CONFLICTS', 'FUNCTIONAL_OVERLAPS'
+})
+_rules_loaded = False
 
 # Known dependency conflicts - loaded from database conflict patterns
 KNOWN_DEPENDENCY_CONFLICTS = [
@@ -74,43 +38,153 @@ KNOWN_DEPENDENCY_CONFLICTS = [
     }
 ]
 
-# Functional overlaps - generated from database categories
-FUNCTIONAL_OVERLAPS = {}
-db = get_tools_database()
-categories = {}
-
-# Group tools by category
-for tool_name, tool_info in KNOWN_AI_TOOLS.items():
-    category = tool_info.get('category')
-    if category:
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(tool_name)
-
-# Create functional overlaps for categories with multiple tools
-for category, tools in categories.items():
-    if len(tools) > 1:
-        # Determine conflict level based on category
-        if category in ['web-interface', 'api-framework']:
-            conflict_level = 'high'
-            description = 'Web interfaces typically conflict on default ports'
-        elif category == 'agent-framework':
-            conflict_level = 'medium'
-            description = 'Multiple agent frameworks may compete for resources'
-        else:
-            conflict_level = 'low'
-            description = f'Multiple {category} tools may cause configuration confusion'
+
+def _build_tool_ports(known_tools: Dict[str, Dict]) -> Dict[str, tuple]:
+    """Known default ports for each tool."""
+    return {
+        sys.intern(tool_name): tuple(tool_info['default_ports'])
+        for tool_name, tool_info in known_tools.items()
+        if tool_info.get('default_ports')
+    }
+
+
+def _build_env_conflicts(known_tools: Dict[str, Dict]) -> Dict[str, frozenset]:
+    """Environment variables used by more than one known tool."""
+    tools_by_env: Dict[str, List[str]] = defaultdict(list)
+    for tool_name, tool_info in known_tools.items():
+        for env_var in tool_info.get('common_env_vars', []):
+            tools_by_env[env_var].append(sys.intern(tool_name))
+    
+    # Only include env vars used by multiple tools (potential conflicts).
+    # Only membership is ever tested on the tool groups.
+    return {
+        sys.intern(env_var): frozenset(tools)
+        for env_var, tools in tools_by_env.items()
+        if len(tools) > 1
+    }
+
+
+def _build_functional_overlaps(known_tools: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Functional overlaps for database categories with multiple tools."""
+    categories: Dict[str, List[str]] = defaultdict(list)
+    for tool_name, tool_info in known_tools.items():
+        category = tool_info.get('category')
+        if category:
+            categories[category].append(sys.intern(tool_name))
+    
+    overlaps = {}
+    for category, tools in categories.items():
+        if len(tools) > 1:
+            # Determine conflict level based on category
+            if category in ['web-interface', 'api-framework']:
+                conflict_level = 'high'
+                description = 'Web interfaces typically conflict on default ports'
+            elif category == 'agent-framework':
+                conflict_level = 'medium'
+                description = 'Multiple agent frameworks may compete for resources'
+            else:
+                conflict_level = 'low'
+                description = f'Multiple {category} tools may cause configuration confusion'
+            
+            overlaps[sys.intern(category)] = {
+                'tools': tuple(tools),
+                'conflict_level': conflict_level,
+                'description': description
+            }
+    return overlaps
+
+
+def _build_port_owners(tool_ports: Dict[str, Iterable[int]]) -> Dict[int, tuple]:
+    """Invert the known tool ports into a port -> owning tools table."""
+    port_owners: Dict[int, List[str]] = defaultdict(list)
+    for tool_name, ports in tool_ports.items():
+        for port in ports:
+            port_owners[port].append(tool_name)
+    return {port: tuple(owners) for port, owners in port_owners.items()}
+
+
+class _KeywordIndex:
+    """Matches tool names against all rule keywords in a single regex pass."""
+    
+    def __init__(self, rules: Dict[str, Iterable[str]]):
+        self._rules = {rule_key: list(keywords) for rule_key, keywords in rules.items()}
         
-        FUNCTIONAL_OVERLAPS[category] = {
-            'tools': tools,
-            'conflict_level': conflict_level,
-            'description': description
+        rules_by_keyword: Dict[str, Set[str]] = {}
+        for rule_key, keywords in self._rules.items():
+            for keyword in keywords:
+                rules_by_keyword.setdefault(keyword, set()).add(rule_key)
+        
+        # The lookahead reports the longest keyword starting at each position,
+        # so every keyword also carries the rules of the keywords it contains.
+        self._keyword_rules = {
+            keyword: set().union(*(
+                rule_keys for other, rule_keys in rules_by_keyword.items() if other in keyword
+            ))
+            for keyword in rules_by_keyword
+        }
+        alternation = '|'.join(
+            re.escape(keyword) for keyword in sorted(rules_by_keyword, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f'(?=({alternation}))') if alternation else None
+        self._keyword_blob = '\0'.join(rules_by_keyword)
+    
+    def rules_in(self, text: str) -> Set[str]:
+        """Return the rules with a keyword that occurs in ``text``."""
+        matched = set()
+        if self._pattern is not None:
+            for keyword in self._pattern.findall(text):
+                matched |= self._keyword_rules[keyword]
+        return matched
+    
+    def rules_containing(self, text: str) -> Set[str]:
+        """Return the rules with a keyword that contains ``text``."""
+        if text not in self._keyword_blob:
+            return set()
+        return {
+            rule_key for rule_key, keywords in self._rules.items()
+            if any(text in keyword for keyword in keywords)
         }
 
 
+def _load_rule_tables():
+    """Load known tools from the database and build every derived rule table."""
+    global KNOWN_AI_TOOLS, KNOWN_TOOL_PORTS, KNOWN_ENV_CONFLICTS, FUNCTIONAL_OVERLAPS
+    global _STATIC_PORT_OWNERS, _ENV_KEYWORD_INDEX, _OVERLAP_KEYWORD_INDEX
+    global _ENV_CONFLICT_VARS, _OVERLAP_CATEGORIES, _rules_loaded
+    
+    KNOWN_AI_TOOLS = get_tools_database().get_all_tools()
+    KNOWN_TOOL_PORTS = _build_tool_ports(KNOWN_AI_TOOLS)
+    KNOWN_ENV_CONFLICTS = _build_env_conflicts(KNOWN_AI_TOOLS)
+    FUNCTIONAL_OVERLAPS = _build_functional_overlaps(KNOWN_AI_TOOLS)
+    
+    _STATIC_PORT_OWNERS = _build_port_owners(KNOWN_TOOL_PORTS)
+    _ENV_KEYWORD_INDEX = _KeywordIndex(KNOWN_ENV_CONFLICTS)
+    _OVERLAP_KEYWORD_INDEX = _KeywordIndex(
+        {category: info['tools'] for category, info in FUNCTIONAL_OVERLAPS.items()}
+    )
+    _ENV_CONFLICT_VARS = frozenset(KNOWN_ENV_CONFLICTS)
+    _OVERLAP_CATEGORIES = frozenset(FUNCTIONAL_OVERLAPS)
+    _rules_loaded = True
+
+
+def _ensure_rule_tables():
+    """Build the rule tables if this is their first use."""
+    if not _rules_loaded:
+        _load_rule_tables()
+
+
+def __getattr__(name: str):
+    """Build the database-derived rule tables on first module attribute access."""
+    if name in _RULE_TABLE_NAMES:
+        _load_rule_tables()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Database helper functions
 def get_tool_info(tool_name: str) -> Dict:
     """Get tool information from database."""
+    _ensure_rule_tables()
     return KNOWN_AI_TOOLS.get(tool_name.lower(), {})
 
 def get_tools_by_category(category: str) -> Dict[str, Dict]:
@@ -130,136 +204,289 @@ def get_database_info() -> Dict:
 
 def reload_tools_database():
     """Reload the tools database."""
-    global KNOWN_AI_TOOLS, KNOWN_TOOL_PORTS, KNOWN_ENV_CONFLICTS, FUNCTIONAL_OVERLAPS
     from .tools_database_loader import reload_database
     
     reload_database()
     
-    # Reload all derived data
-    KNOWN_AI_TOOLS = _load_known_tools()
+    # Rebuild all derived data
+    _load_rule_tables()
+    
+    print("Tools database reloaded successfully")
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ConflictRecord(ABC):
+    """A conflict found by the static rules.
+    
+    Message text is formatted on access by the subclasses, so callers that
+    only look at severity or the tools involved never pay for it.
+    """
+    source: ClassVar[str] = 'static_rule'
     
-    # Reload port data
-    KNOWN_TOOL_PORTS = {}
-    for tool_name, tool_info in KNOWN_AI_TOOLS.items():
-        ports = tool_info.get('default_ports', [])
-        if ports:
-            KNOWN_TOOL_PORTS[tool_name] = ports
+    type: str
+    severity: str
+    tools_involved: List[str]
+    confidence: str
     
-    # Reload env conflicts
-    tools_by_env = {}
-    for tool_name, tool_info in KNOWN_AI_TOOLS.items():
-        env_vars = tool_info.get('common_env_vars', [])
-        for env_var in env_vars:
-            if env_var not in tools_by_env:
-                tools_by_env[env_var] = []
-            tools_by_env[env_var].append(tool_name)
+    @property
+    @abstractmethod
+    def description(self) -> str:
+        """One-line summary of the conflict."""
     
-    KNOWN_ENV_CONFLICTS = {
-        env_var: tools for env_var, tools in tools_by_env.items()
-        if len(tools) > 1
-    }
+    @property
+    @abstractmethod
+    def potential_issues(self) -> str:
+        """What goes wrong if the conflict is left alone."""
     
-    print("Tools database reloaded successfully")
+    @property
+    @abstractmethod
+    def mitigation(self) -> str:
+        """Suggested fix for the conflict."""
+    
+    def to_dict(self) -> Dict[str, any]:
+        """Return the conflict in the dict form used by analyzers and reporters."""
+        return {
+            'type': self.type,
+            'severity': self.severity,
+            'tools_involved': self.tools_involved,
+            'description': self.description,
+            'potential_issues': self.potential_issues,
+            'mitigation': self.mitigation,
+            'confidence': self.confidence,
+            'source': self.source
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
+class PortConflictRecord(ConflictRecord):
+    """Several tools claiming the same port."""
+    port: int
+    
+    @property
+    def description(self) -> str:
+        count = len(self.tools_involved)
+        who = 'Both tools' if count == 2 else f'{count} tools'
+        return f'{who} use port {self.port}'
+    
+    @property
+    def potential_issues(self) -> str:
+        who = 'both tools' if len(self.tools_involved) == 2 else 'these tools'
+        return f'Cannot run {who} simultaneously on port {self.port}'
+    
+    @property
+    def mitigation(self) -> str:
+        return f'Configure one tool to use a different port (e.g., --port {self.port + 1})'
+
+
+@dataclass(**DATACLASS_SLOTS)
+class EnvConflictRecord(ConflictRecord):
+    """Several tools reading the same environment variable."""
+    env_var: str
+    
+    @property
+    def description(self) -> str:
+        return f'Multiple tools may use environment variable {self.env_var}'
+    
+    @property
+    def potential_issues(self) -> str:
+        return 'Environment variable conflicts may cause authentication issues'
+    
+    @property
+    def mitigation(self) -> str:
+        return f'Ensure {self.env_var} is set correctly for all tools that need it'
+
+
+@dataclass(**DATACLASS_SLOTS)
+class OverlapConflictRecord(ConflictRecord):
+    """Several tools from the same functional category."""
+    overlap_description: str
+    
+    @property
+    def description(self) -> str:
+        return self.overlap_description
+    
+    @property
+    def potential_issues(self) -> str:
+        return 'May cause resource competition or user confusion'
+    
+    @property
+    def mitigation(self) -> str:
+        return 'Consider using only one tool from this category, or configure them carefully'
+
+
+class _ToolScan(NamedTuple):
+    """Per-run accumulators shared by the static detectors."""
+    tool_positions: Dict[str, int]
+    port_to_tools: Dict[int, List[str]]
+    env_to_tools: Dict[str, List[str]]
+    category_to_tools: Dict[str, List[str]]
+
+
+def _normalize_tools(tools: List[Dict[str, any]]) -> List[Tuple[str, Dict]]:
+    """Lowercase each tool name and resolve its metadata once."""
+    return [
+        (tool.get('name', '').lower(), tool.get('metadata') or _EMPTY_DICT)
+        for tool in tools
+    ]
+
+
+def _scan_tools(tools: List[Tuple[str, Dict]]) -> _ToolScan:
+    """Collect ports, env vars and categories for all tools in one pass."""
+    _ensure_rule_tables()
+    tool_positions: Dict[str, int] = {}
+    port_to_tools: Dict[int, List[str]] = defaultdict(list)
+    env_to_tools: Dict[str, List[str]] = defaultdict(list)
+    category_to_tools: Dict[str, List[str]] = defaultdict(list)
+
+    for tool_name, metadata in tools:
+        tool_positions.setdefault(tool_name, len(tool_positions))
+
+        for port in metadata.get('ports') or _EMPTY_TUPLE:
+            owners = port_to_tools[port]
+            if tool_name not in owners:
+                owners.append(tool_name)
+
+        # Env vars used by the tool, either extracted or known by name
+        tool_envs = (_ENV_KEYWORD_INDEX.rules_in(tool_name) |
+                     _ENV_KEYWORD_INDEX.rules_containing(tool_name))
+        tool_envs |= _ENV_CONFLICT_VARS.intersection(
+            metadata.get('environment_vars') or _EMPTY_TUPLE
+        )
+        for env_var in tool_envs:
+            env_to_tools[env_var].append(tool_name)
+
+        tool_categories = _OVERLAP_KEYWORD_INDEX.rules_in(tool_name)
+        tool_categories |= _OVERLAP_CATEGORIES.intersection(
+            metadata.get('categories') or _EMPTY_TUPLE
+        )
+        for category in tool_categories:
+            category_to_tools[category].append(tool_name)
+
+    # Merge in the default ports of known tools taking part in this run
+    for port, static_owners in _STATIC_PORT_OWNERS.items():
+        for tool_name in static_owners:
+            if tool_name in tool_positions:
+                owners = port_to_tools[port]
+                # Port may be listed both as extracted and known for this tool
+                if tool_name not in owners:
+                    owners.append(tool_name)
+
+    return _ToolScan(tool_positions, port_to_tools, env_to_tools, category_to_tools)
+
+
+def detect_port_conflicts(tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    """Detect port conflicts between tools."""
+    records = _emit_port_conflicts(_scan_tools(_normalize_tools(tools)))
+    return [record.to_dict() for record in records]
+
+
+def _emit_port_conflicts(scan: _ToolScan) -> List[ConflictRecord]:
+    conflicts = []
+
+    # Report every port claimed by more than one tool
+    for port, owners in scan.port_to_tools.items():
+        if len(owners) < 2:
+            continue
+        owners.sort(key=scan.tool_positions.__getitem__)
+        conflicts.append(PortConflictRecord(
+            type='port_conflict',
+            severity='high',
+            tools_involved=owners,
+            confidence='high',
+            port=port
+        ))
+
+    return conflicts
+
+
+def detect_env_conflicts(tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    """Detect environment variable conflicts."""
+    records = _emit_env_conflicts(_scan_tools(_normalize_tools(tools)))
+    return [record.to_dict() for record in records]
+
+
+def _emit_env_conflicts(scan: _ToolScan) -> List[ConflictRecord]:
+    conflicts = []
+
+    for env_var in KNOWN_ENV_CONFLICTS:
+        matching_tools = scan.env_to_tools.get(env_var, _EMPTY_TUPLE)
+
+        if len(matching_tools) > 1:
+            conflicts.append(EnvConflictRecord(
+                type='environment_conflict',
+                severity='medium',
+                tools_involved=matching_tools,
+                confidence='medium',
+                env_var=env_var
+            ))
+
+    return conflicts
+
+
+def detect_functional_overlaps(tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    """Detect functional overlaps between tools."""
+    records = _emit_functional_overlaps(_scan_tools(_normalize_tools(tools)))
+    return [record.to_dict() for record in records]
+
+
+def _emit_functional_overlaps(scan: _ToolScan) -> List[ConflictRecord]:
+    conflicts = []
+
+    for category, overlap_info in FUNCTIONAL_OVERLAPS.items():
+        matching_tools = scan.category_to_tools.get(category, _EMPTY_TUPLE)
+
+        if len(matching_tools) > 1:
+            conflicts.append(OverlapConflictRecord(
+                type='functionality_overlap',
+                severity=overlap_info['conflict_level'],
+                tools_involved=matching_tools,
+                confidence='high',
+                overlap_description=overlap_info['description']
+            ))
+
+    return conflicts
+
+
+def detect_all_static_records(tools: List[Dict[str, any]]) -> List[ConflictRecord]:
+    """Run all static conflict detection methods, returning ConflictRecord objects."""
+    all_conflicts = []
+    scan = _scan_tools(_normalize_tools(tools))
+
+    all_conflicts.extend(_emit_port_conflicts(scan))
+    all_conflicts.extend(_emit_env_conflicts(scan))
+    all_conflicts.extend(_emit_functional_overlaps(scan))
+
+    return all_conflicts
+
+
+def detect_all_static_conflicts(tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    """Run all static conflict detection methods."""
+    return [record.to_dict() for record in detect_all_static_records(tools)]
 
 
 class StaticConflictDetector:
-    """Detects conflicts using database rules for AI tools."""
+    """Detects conflicts using database rules for AI tools.
+    
+    Kept for backward compatibility; the detectors are stateless module-level
+    functions and these methods simply forward to them.
+    """
     
     def detect_port_conflicts(self, tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
         """Detect port conflicts between tools."""
-        conflicts = []
-        port_usage = {}
-        
-        # Check extracted ports and known tool ports
-        for tool in tools:
-            tool_name = tool.get('name', '').lower()
-            extracted_ports = tool.get('metadata', {}).get('ports', [])
-            known_ports = KNOWN_TOOL_PORTS.get(tool_name, [])
-            
-            all_ports = list(set(extracted_ports + known_ports))
-            
-            for port in all_ports:
-                if port in port_usage:
-                    conflicts.append({
-                        'type': 'port_conflict',
-                        'severity': 'high',
-                        'tools_involved': [port_usage[port], tool_name],
-                        'description': f'Both tools use port {port}',
-                        'potential_issues': f'Cannot run both tools simultaneously on port {port}',
-                        'mitigation': f'Configure one tool to use a different port (e.g., --port {port + 1})',
-                        'confidence': 'high',
-                        'source': 'static_rule'
-                    })
-                else:
-                    port_usage[port] = tool_name
-        
-        return conflicts
+        return detect_port_conflicts(tools)
     
     def detect_env_conflicts(self, tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
         """Detect environment variable conflicts."""
-        conflicts = []
-        
-        for env_var, related_tools in KNOWN_ENV_CONFLICTS.items():
-            matching_tools = []
-            
-            for tool in tools:
-                tool_name = tool.get('name', '').lower()
-                extracted_envs = tool.get('metadata', {}).get('environment_vars', [])
-                
-                # Check if tool uses this env var (either extracted or known)
-                if (env_var in extracted_envs or 
-                    any(tool_name in related_tool or related_tool in tool_name for related_tool in related_tools)):
-                    matching_tools.append(tool_name)
-            
-            if len(matching_tools) > 1:
-                conflicts.append({
-                    'type': 'environment_conflict',
-                    'severity': 'medium',
-                    'tools_involved': matching_tools,
-                    'description': f'Multiple tools may use environment variable {env_var}',
-                    'potential_issues': 'Environment variable conflicts may cause authentication issues',
-                    'mitigation': f'Ensure {env_var} is set correctly for all tools that need it',
-                    'confidence': 'medium',
-                    'source': 'static_rule'
-                })
-        
-        return conflicts
+        return detect_env_conflicts(tools)
     
     def detect_functional_overlaps(self, tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
         """Detect functional overlaps between tools."""
-        conflicts = []
-        
-        for category, overlap_info in FUNCTIONAL_OVERLAPS.items():
-            matching_tools = []
-            
-            for tool in tools:
-                tool_name = tool.get('name', '').lower()
-                tool_categories = tool.get('metadata', {}).get('categories', [])
-                
-                if (category in tool_categories or 
-                    any(overlap_tool in tool_name for overlap_tool in overlap_info['tools'])):
-                    matching_tools.append(tool_name)
-            
-            if len(matching_tools) > 1:
-                conflicts.append({
-                    'type': 'functionality_overlap',
-                    'severity': overlap_info['conflict_level'],
-                    'tools_involved': matching_tools,
-                    'description': overlap_info['description'],
-                    'potential_issues': 'May cause resource competition or user confusion',
-                    'mitigation': 'Consider using only one tool from this category, or configure them carefully',
-                    'confidence': 'high',
-                    'source': 'static_rule'
-                })
-        
-        return conflicts
+        return detect_functional_overlaps(tools)
+    
+    def detect_all_static_records(self, tools: List[Dict[str, any]]) -> List[ConflictRecord]:
+        """Run all static conflict detection methods, returning ConflictRecord objects."""
+        return detect_all_static_records(tools)
     
     def detect_all_static_conflicts(self, tools: List[Dict[str, any]]) -> List[Dict[str, any]]:
         """Run all static conflict detection methods."""
-        all_conflicts = []
-        
-        all_conflicts.extend(self.detect_port_conflicts(tools))
-        all_conflicts.extend(self.detect_env_conflicts(tools))
-        all_conflicts.extend(self.detect_functional_overlaps(tools))
-        
-        return all_conflicts
\ No newline at end of file
+        return detect_all_static_conflicts(tools)
@@ -35,260 +35,6 @@ def _load_known_tools() -> Dict[str, Dict]:
 # Known AI tools - loaded from external database  
 KNOWN_AI_TOOLS = _load_known_tools()
 
-# Legacy tools data (kept for backward compatibility, but loaded from database)
-_LEGACY_KNOWN_AI_TOOLS = {
-    'streamlit': {
-        'package_names': ['streamlit'],
-        'github_url': 'https://github.com/streamlit/streamlit',
-        'category': 'web-interface',
-        'default_ports': [8501],
-        'common_env_vars': ['STREAMLIT_SERVER_PORT'],
-        'description': 'Web app framework for ML/AI applications'
-    },
-    'gradio': {
-        'package_names': ['gradio'],
-        'github_url': 'https://github.com/gradio-app/gradio',
-        'category': 'web-interface',
-        'default_ports': [7860, 7861, 7862],
-        'common_env_vars': ['GRADIO_SERVER_PORT'],
-        'description': 'Web UI for ML models'
-    },
-    'jupyter': {
-        'package_names': ['jupyter', 'jupyterlab', 'notebook'],
-        'github_url': 'https://github.com/jupyter/notebook',
-        'category': 'notebook',
-        'default_ports': [8888, 8889],
-        'common_env_vars': ['JUPYTER_PORT', 'JUPYTER_TOKEN'],
-        'description': 'Interactive computing environment'
-    },
-    'langchain': {
-        'package_names': ['langchain', 'langchain-core', 'langchain-community'],
-        'github_url': 'https://github.com/langchain-ai/langchain',
-        'category': 'llm-framework',
-        'default_ports': [],
-        'common_env_vars': ['LANGCHAIN_API_KEY', 'LANGSMITH_API_KEY'],
-        'description': 'LLM application framework'
-    },
-    'openai': {
-        'package_names': ['openai'],
-        'github_url': 'https://github.com/openai/openai-python',
-        'category': 'llm-client',
-        'default_ports': [],
-        'common_env_vars': ['OPENAI_API_KEY'],
-        'description': 'OpenAI API client'
-    },
-    'transformers': {
-        'package_names': ['transformers'],
-        'github_url': 'https://github.com/huggingface/transformers',
-        'category': 'ml-library',
-        'default_ports': [],
-        'common_env_vars': ['HUGGINGFACE_API_TOKEN', 'HF_TOKEN'],
-        'description': 'HuggingFace transformers library'
-    },
-    'torch': {
-        'package_names': ['torch', 'pytorch'],
-        'github_url': 'https://github.com/pytorch/pytorch',
-        'category': 'ml-framework',
-        'default_ports': [],
-        'common_env_vars': ['CUDA_VISIBLE_DEVICES'],
-        'description': 'PyTorch deep learning framework'
-    },
-    'tensorflow': {
-        'package_names': ['tensorflow', 'tensorflow-gpu'],
-        'github_url': 'https://github.com/tensorflow/tensorflow',
-        'category': 'ml-framework',
-        'default_ports': [],
-        'common_env_vars': ['CUDA_VISIBLE_DEVICES', 'TF_CPP_MIN_LOG_LEVEL'],
-        'description': 'TensorFlow machine learning platform'
-    },
-    'fastapi': {
-        'package_names': ['fastapi'],
-        'github_url': 'https://github.com/tiangolo/fastapi',
-        'category': 'api-framework',
-        'default_ports': [8000],
-        'common_env_vars': [],
-        'description': 'Modern web framework for APIs'
-    },
-    'flask': {
-        'package_names': ['flask'],
-        'github_url': 'https://github.com/pallets/flask',
-        'category': 'web-framework',
-        'default_ports': [5000],
-        'common_env_vars': ['FLASK_APP', 'FLASK_ENV'],
-        'description': 'Lightweight web framework'
-    },
-    'mlflow': {
-        'package_names': ['mlflow'],
-        'github_url': 'https://github.com/mlflow/mlflow',
-        'category': 'ml-ops',
-        'default_ports': [5000, 5001],
-        'common_env_vars': ['MLFLOW_TRACKING_URI'],
-        'description': 'ML lifecycle management'
-    },
-    'wandb': {
-        'package_names': ['wandb'],
-        'github_url': 'https://github.com/wandb/wandb',
-        'category': 'ml-ops',
-        'default_ports': [8080],
-        'common_env_vars': ['WANDB_API_KEY', 'WANDB_PROJECT'],
-        'description': 'ML experiment tracking'
-    },
-    'tensorboard': {
-        'package_names': ['tensorboard'],
-        'github_url': 'https://github.com/tensorflow/tensorboard',
-        'category': 'visualization',
-        'default_ports': [6006],
-        'common_env_vars': [],
-        'description': 'Visualization toolkit for ML'
-    },
-    'crewai': {
-        'package_names': ['crewai'],
-        'github_url': 'https://github.com/joaomdmoura/crewAI',
-        'category': 'agent-framework',
-        'default_ports': [],
-        'common_env_vars': ['OPENAI_API_KEY'],
-        'description': 'Multi-agent orchestration framework'
-    },
-    'autogen': {
-        'package_names': ['pyautogen'],
-        'github_url': 'https://github.com/microsoft/autogen',
-        'category': 'agent-framework',
-        'default_ports': [],
-        'common_env_vars': ['OPENAI_API_KEY'],
-        'description': 'Multi-agent conversation framework'
-    },
-    'bmad': {
-        'package_names': ['bmad-method'],
-        'github_url': 'https://github.com/chendav/BMAD-METHOD',
-        'category': 'agent-framework',
-        'default_ports': [],
-        'common_env_vars': ['OPENAI_API_KEY', 'ANTHROPIC_API_KEY'],
-        'description': 'Breakthrough Method of Agile AI-driven Development',
-        'detection_patterns': {
-            'directories': ['.bmad-core'],
-            'files': ['bmad-master.md', 'bmad-orchestrator.md'],
-            'config_files': ['core-config.yaml', 'install-manifest.yaml']
-        }
-    },
-    'nextjs': {
-        'package_names': ['next'],
-        'github_url': 'https://github.com/vercel/next.js',
-        'category': 'web-framework',
-        'default_ports': [3000],
-        'common_env_vars': ['NEXT_PUBLIC_API_URL'],
-        'description': 'React framework for production',
-        'detection_patterns': {
-            'files': ['next.config.js', 'next.config.ts'],
-            'directories': ['.next', 'pages', 'app'],
-            'config_files': ['next.config.js', 'next.config.ts']
-        }
-    },
-    'django': {
-        'package_names': ['django'],
-        'github_url': 'https://github.com/django/django',
-        'category': 'web-framework',
-        'default_ports': [8000],
-        'common_env_vars': ['DJANGO_SECRET_KEY', 'DJANGO_DEBUG'],
-        'description': 'High-level Python web framework',
-        'detection_patterns': {
-            'files': ['manage.py', 'settings.py', 'urls.py'],
-            'directories': ['migrations'],
-            'config_files': ['settings.py', 'wsgi.py']
-        }
-    },
-    'hugginface-transformers': {
-        'package_names': ['transformers'],
-        'github_url': 'https://github.com/huggingface/transformers',
-        'category': 'ml-framework',
-        'default_ports': [],
-        'common_env_vars': ['HF_TOKEN', 'HUGGINGFACE_HUB_CACHE'],
-        'description': 'State-of-the-art ML models',
-        'detection_patterns': {
-            'directories': ['models', '.cache/huggingface'],
-            'files': ['config.json', 'tokenizer.json'],
-            'config_files': ['config.json']
-        }
-    },
-    'langchain-serve': {
-        'package_names': ['langchain', 'langserve'],
-        'github_url': 'https://github.com/langchain-ai/langserve',
-        'category': 'llm-framework',
-        'default_ports': [8000],
-        'common_env_vars': ['LANGCHAIN_API_KEY', 'LANGSMITH_API_KEY'],
-        'description': 'LangChain serving framework',
-        'detection_patterns': {
-            'files': ['langchain_serve.py', 'chain.py'],
-            'directories': ['chains', 'agents'],
-            'config_files': ['langchain.yaml']
-        }
-    },
-    'llamaindex': {
-        'package_names': ['llama-index', 'llama_index'],
-        'github_url': 'https://github.com/run-llama/llama_index',
-        'category': 'rag-framework',
-        'default_ports': [],
-        'common_env_vars': ['OPENAI_API_KEY', 'LLAMA_INDEX_CACHE_DIR'],
-        'description': 'Data framework for LLM applications',
-        'detection_patterns': {
-            'directories': ['indices', 'storage'],
-            'files': ['index.json', 'docstore.json'],
-            'config_files': ['llamaindex.yaml']
-        }
-    },
-    'chainlit': {
-        'package_names': ['chainlit'],
-        'github_url': 'https://github.com/Chainlit/chainlit',
-        'category': 'chat-interface',
-        'default_ports': [8000],
-        'common_env_vars': ['CHAINLIT_AUTH_SECRET'],
-        'description': 'Build Python LLM apps in minutes',
-        'detection_patterns': {
-            'files': ['app.py', 'chainlit.md'],
-            'directories': ['.chainlit'],
-            'config_files': ['chainlit.toml', '.chainlit/config.toml']
-        }
-    },
-    'memgpt': {
-        'package_names': ['memgpt', 'pymemgpt'],
-        'github_url': 'https://github.com/cpacker/MemGPT',
-        'category': 'memory-framework',
-        'default_ports': [8283],
-        'common_env_vars': ['MEMGPT_CONFIG_PATH', 'OPENAI_API_KEY'],
-        'description': 'Create LLM agents with long-term memory',
-        'detection_patterns': {
-            'directories': ['.memgpt', 'memgpt_config'],
-            'files': ['memgpt_config.yaml', 'agent_config.json'],
-            'config_files': ['memgpt_config.yaml']
-        }
-    },
-    'autogen-studio': {
-        'package_names': ['autogen-studio'],
-        'github_url': 'https://github.com/microsoft/autogen',
-        'category': 'agent-framework',
-        'default_ports': [8081],
-        'common_env_vars': ['OPENAI_API_KEY'],
-        'description': 'AutoGen Studio UI for multi-agent conversations',
-        'detection_patterns': {
-            'directories': ['autogen_studio', '.autogen'],
-            'files': ['autogen_config.json'],
-            'config_files': ['autogen_config.json']
-        }
-    },
-    'semantic-kernel': {
-        'package_names': ['semantic-kernel'],
-        'github_url': 'https://github.com/microsoft/semantic-kernel',
-        'category': 'agent-framework',
-        'default_ports': [],
-        'common_env_vars': ['AZURE_OPENAI_API_KEY', 'OPENAI_API_KEY'],
-        'description': 'Microsoft Semantic Kernel SDK',
-        'detection_patterns': {
-            'directories': ['skills', 'plugins'],
-            'files': ['kernel_config.json', 'skills.yaml'],
-            'config_files': ['kernel_config.json']
-        }
-    }
-}
-
 # Known environment variable conflicts
 KNOWN_ENV_CONFLICTS = {
     'OPENAI_API_KEY': ['openai', 'langchain', 'llama-index', 'autogen'],
@@ -1,17 +1,68 @@
 """Tools Database Loader - Interface for the static AI tools database."""
 
+import os
+import pickle
 import yaml
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _load_yaml_sections(stream) -> Dict[str, Any]:
+    """Parse a YAML mapping one top-level section at a time.
+    
+    Each section's node tree is released as soon as it has been constructed,
+    so peak memory stays close to the size of the resulting dict instead of
+    holding the full node graph and the constructed data at once.
+    """
+    loader = _YamlLoader(stream)
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            return {}
+        if not isinstance(root, yaml.MappingNode):
+            return loader.construct_document(root)
+        
+        database = {}
+        pairs = root.value
+        pairs.reverse()
+        while pairs:
+            key_node, value_node = pairs.pop()
+            key = loader.construct_object(key_node, deep=True)
+            database[key] = loader.construct_object(value_node, deep=True)
+            # Drop the constructor's node -> object memo for this section
+            loader.constructed_objects.clear()
+        return database
+    finally:
+        loader.dispose()
+
+
+# Structure checked by ToolsDatabaseLoader.validate_database
+REQUIRED_SECTIONS = ('tools', 'categories')
+REQUIRED_TOOL_FIELDS = ('name', 'description', 'category')
 
 
 class ToolsDatabaseLoader:
     """Loads and provides access to the static AI tools database."""
     
+    # Cached top-level sections and derived indices, reset whenever the database is (re)loaded
+    _SECTION_ATTRS = (
+        '_tools', '_categories', '_port_conflicts', '_env_conflicts',
+        '_detection_signatures', '_conflict_patterns', '_compatibility_matrix',
+        '_installation_commands', '_documentation', '_search_index',
+    )
+    
     def __init__(self, database_path: Optional[str] = None):
         """
         Initialize the database loader.
         
+        The YAML file is parsed lazily on first access.
+        
         Args:
             database_path: Path to the tools database YAML file
         """
@@ -22,24 +73,130 @@ class ToolsDatabaseLoader:
         
         self.database_path = Path(database_path)
         self._database = None
-        self._load_database()
+        
+        # Per-instance lookup caches, keyed by the lowercased tool name
+        self._tool_cache = lru_cache(maxsize=256)(self._lookup_tool)
+        self._installation_command_cache = lru_cache(maxsize=256)(self._lookup_installation_command)
+        self._documentation_url_cache = lru_cache(maxsize=256)(self._lookup_documentation_url)
+    
+    @property
+    def database(self) -> Dict[str, Any]:
+        """The parsed database, loaded on first access."""
+        if self._database is None:
+            self._load_database()
+        return self._database
+    
+    @property
+    def snapshot_path(self) -> Path:
+        """Path of the pickled snapshot kept next to the YAML file."""
+        return self.database_path.with_name(self.database_path.name + '.pkl')
     
     def _load_database(self):
-        """Load the tools database from YAML file."""
+        """Load the tools database, preferring an up-to-date pickled snapshot."""
+        database = self._load_snapshot()
+        if database is None:
+            try:
+                with open(self.database_path, 'r', encoding='utf-8') as f:
+                    database = _load_yaml_sections(f)
+            except Exception as e:
+                raise Exception(f"Failed to load tools database from {self.database_path}: {e}")
+            self._save_snapshot(database)
+        
+        self._database = database
+        self._clear_caches()
+    
+    def _load_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Load the pickled snapshot if it is newer than the YAML file."""
         try:
-            with open(self.database_path, 'r', encoding='utf-8') as f:
-                self._database = yaml.safe_load(f)
-        except Exception as e:
-            raise Exception(f"Failed to load tools database from {self.database_path}: {e}")
+            if self.snapshot_path.stat().st_mtime_ns <= self.database_path.stat().st_mtime_ns:
+                return None
+            with open(self.snapshot_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+    
+    def _save_snapshot(self, database: Dict[str, Any]):
+        """Atomically write a pickled snapshot; failures are not fatal."""
+        tmp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(database, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            # Read-only install location; keep parsing the YAML file
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def _clear_caches(self):
+        """Invalidate cached sections and lookups after the database has been (re)loaded."""
+        for attr in self._SECTION_ATTRS:
+            self.__dict__.pop(attr, None)
+        self._tool_cache.cache_clear()
+        self._installation_command_cache.cache_clear()
+        self._documentation_url_cache.cache_clear()
+    
+    @cached_property
+    def _tools(self) -> Dict[str, Dict]:
+        return self.database.get('tools', {})
+    
+    @cached_property
+    def _categories(self) -> Dict[str, str]:
+        return self.database.get('categories', {})
+    
+    @cached_property
+    def _port_conflicts(self) -> Dict[str, List[int]]:
+        return self.database.get('port_conflicts', {})
+    
+    @cached_property
+    def _env_conflicts(self) -> Dict[str, List[str]]:
+        return self.database.get('env_conflicts', {})
+    
+    @cached_property
+    def _detection_signatures(self) -> Dict[str, Dict]:
+        return self.database.get('detection_signatures', {})
+    
+    @cached_property
+    def _conflict_patterns(self) -> Dict[str, Dict]:
+        return self.database.get('conflict_patterns', {})
+    
+    @cached_property
+    def _compatibility_matrix(self) -> Dict[str, Dict]:
+        return self.database.get('compatibility_matrix', {})
+    
+    @cached_property
+    def _installation_commands(self) -> Dict[str, str]:
+        return self.database.get('installation_commands', {})
+    
+    @cached_property
+    def _documentation(self) -> Dict[str, str]:
+        return self.database.get('documentation', {})
+    
+    @cached_property
+    def _search_index(self) -> List[Tuple[str, str, str, str, Dict]]:
+        """Lowercased name, description and category for every tool."""
+        return [
+            (
+                tool_name.lower(),
+                tool_info.get('description', '').lower(),
+                tool_info.get('category', '').lower(),
+                tool_name,
+                tool_info,
+            )
+            for tool_name, tool_info in self._tools.items()
+        ]
     
     def get_all_tools(self) -> Dict[str, Dict]:
         """Get all tools from the database."""
-        return self._database.get('tools', {})
+        return self._tools
     
     def get_tool(self, tool_name: str) -> Optional[Dict]:
         """Get specific tool information."""
-        tools = self.get_all_tools()
-        return tools.get(tool_name.lower())
+        return self._tool_cache(tool_name.lower())
+    
+    def _lookup_tool(self, tool_key: str) -> Optional[Dict]:
+        return self.get_all_tools().get(tool_key)
     
     def get_tool_by_package(self, package_name: str) -> Optional[tuple[str, Dict]]:
         """Find tool by package name."""
@@ -63,68 +220,55 @@ class ToolsDatabaseLoader:
     
     def get_port_conflicts(self) -> Dict[str, List[int]]:
         """Get port conflict groups."""
-        return self._database.get('port_conflicts', {})
+        return self._port_conflicts
     
     def get_env_conflicts(self) -> Dict[str, List[str]]:
         """Get environment variable conflict groups."""
-        return self._database.get('env_conflicts', {})
+        return self._env_conflicts
     
     def get_detection_signatures(self) -> Dict[str, Dict]:
         """Get detection signatures for dynamic analysis."""
-        return self._database.get('detection_signatures', {})
+        return self._detection_signatures
     
     def get_conflict_patterns(self) -> Dict[str, Dict]:
         """Get conflict pattern definitions."""
-        return self._database.get('conflict_patterns', {})
+        return self._conflict_patterns
     
     def get_compatibility_matrix(self) -> Dict[str, Dict]:
         """Get version compatibility information."""
-        return self._database.get('compatibility_matrix', {})
+        return self._compatibility_matrix
     
     def get_installation_command(self, tool_name: str) -> Optional[str]:
         """Get installation command for a tool."""
-        commands = self._database.get('installation_commands', {})
-        return commands.get(tool_name.lower())
+        return self._installation_command_cache(tool_name.lower())
+    
+    def _lookup_installation_command(self, tool_key: str) -> Optional[str]:
+        return self._installation_commands.get(tool_key)
     
     def get_documentation_url(self, tool_name: str) -> Optional[str]:
         """Get documentation URL for a tool."""
-        docs = self._database.get('documentation', {})
-        return docs.get(tool_name.lower())
+        return self._documentation_url_cache(tool_name.lower())
+    
+    def _lookup_documentation_url(self, tool_key: str) -> Optional[str]:
+        return self._documentation.get(tool_key)
     
     def search_tools(self, query: str) -> List[tuple[str, Dict]]:
         """Search tools by name, description, or category."""
         query_lower = query.lower()
-        results = []
-        
-        tools = self.get_all_tools()
-        for tool_name, tool_info in tools.items():
-            # Search in name
-            if query_lower in tool_name.lower():
-                results.append((tool_name, tool_info))
-                continue
-            
-            # Search in description
-            description = tool_info.get('description', '').lower()
-            if query_lower in description:
-                results.append((tool_name, tool_info))
-                continue
-            
-            # Search in category
-            category = tool_info.get('category', '').lower()
-            if query_lower in category:
-                results.append((tool_name, tool_info))
-                continue
-        
-        return results
+        return [
+            (tool_name, tool_info)
+            for name_lower, description_lower, category_lower, tool_name, tool_info in self._search_index
+            if query_lower in name_lower or query_lower in description_lower or query_lower in category_lower
+        ]
     
     def get_database_info(self) -> Dict[str, Any]:
         """Get database metadata."""
         return {
-            'version': self._database.get('version'),
-            'last_updated': self._database.get('last_updated'),
-            'description': self._database.get('description'),
+            'version': self.database.get('version'),
+            'last_updated': self.database.get('last_updated'),
+            'description': self.database.get('description'),
             'total_tools': len(self.get_all_tools()),
-            'categories': list(self._database.get('categories', {}).keys()),
+            'categories': list(self._categories.keys()),
             'database_path': str(self.database_path)
         }
     
@@ -132,26 +276,27 @@ class ToolsDatabaseLoader:
         """Validate database structure and return any issues."""
         issues = []
         
-        if not self._database:
+        if not self.database:
             return ["Database not loaded"]
         
         # Check required sections
-        required_sections = ['tools', 'categories']
-        for section in required_sections:
-            if section not in self._database:
+        for section in REQUIRED_SECTIONS:
+            if section not in self.database:
                 issues.append(f"Missing required section: {section}")
         
         # Validate tools
         tools = self.get_all_tools()
+        categories = self._categories
         for tool_name, tool_info in tools.items():
             # Check required fields
-            required_fields = ['name', 'description', 'category']
-            for field in required_fields:
-                if field not in tool_info:
-                    issues.append(f"Tool '{tool_name}' missing required field: {field}")
+            missing = REQUIRED_TOOL_FIELDS - tool_info.keys()
+            if missing:
+                issues.extend(
+                    f"Tool '{tool_name}' missing required field: {field}"
+                    for field in REQUIRED_TOOL_FIELDS if field in missing
+                )
             
             # Check category validity
-            categories = self._database.get('categories', {})
             tool_category = tool_info.get('category')
             if tool_category and tool_category not in categories:
                 issues.append(f"Tool '{tool_name}' has invalid category: {tool_category}")
@@ -159,18 +304,13 @@ class ToolsDatabaseLoader:
         return issues
 
 
-# Global database instance
-_db_instance = None
-
+# Global database instance, created once on first use
+@lru_cache(maxsize=None)
 def get_tools_database() -> ToolsDatabaseLoader:
     """Get the global tools database instance."""
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = ToolsDatabaseLoader()
-    return _db_instance
+    return ToolsDatabaseLoader()
 
 def reload_database():
     """Reload the database (useful for testing or after updates)."""
-    global _db_instance
-    _db_instance = None
+    get_tools_database.cache_clear()
     return get_tools_database()
\ No newline at end of file
@@ -1,10 +1,193 @@
 """User configuration management for AI Pitfall Detector."""
 
+import hashlib
+import heapq
 import json
+import mmap
 import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Set, Any
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+from ._compat import DATACLASS_SLOTS
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+    HAVE_ORJSON = False
+
+# Default locations, computed once per process
+_DEFAULT_CONFIG_DIR = Path.home() / '.ai-pitfall-detector'
+_DEFAULT_REPORT_DIR = Path.home() / 'ai-pitfall-reports'
+
+# Below this size a plain read is cheaper than setting up a mapping
+MMAP_MIN_SIZE = 4096
+# Above this size, ask the kernel to read the whole file in ahead of parsing
+PREFETCH_MIN_SIZE = 64 * 1024
+# Linux only (Python 3.10+)
+_MAP_POPULATE = getattr(mmap, 'MAP_POPULATE', 0)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file, memory-mapping large files for orjson."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not HAVE_ORJSON or size < MMAP_MIN_SIZE:
+            return _json_loads(f.read())
+        with _map_file(f.fileno(), size) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _map_file(fd: int, size: int) -> mmap.mmap:
+    """Map a file read-only, prefetching its pages when it is large."""
+    if size >= PREFETCH_MIN_SIZE:
+        if _MAP_POPULATE:
+            return mmap.mmap(fd, 0, flags=mmap.MAP_SHARED | _MAP_POPULATE, prot=mmap.PROT_READ)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when available."""
+    if HAVE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects stdlib json does not know (orjson handles dataclasses itself)."""
+    if isinstance(obj, ToolEntry):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _digest(data: bytes) -> bytes:
+    """Short content digest used to skip rewriting unchanged files."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _without_stamp(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copy of a config without its last_updated stamp."""
+    return {k: v for k, v in config.items() if k != 'last_updated'}
+
+
+def _append_stamp(data: bytes, stamp: Any) -> bytes:
+    """Add a last_updated key to serialized JSON object bytes.
+    
+    Lets a save digest the stamp-free bytes and write them without
+    serializing the whole object a second time.
+    """
+    entry = b'"last_updated": ' + _json_dumps(stamp)
+    if data == b'{}':
+        return b'{\n  ' + entry + b'\n}'
+    return data[:-2] + b',\n  ' + entry + b'\n}'
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to a sibling temp file and swap it into place."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+# Timestamps taken within this many seconds of each other are shared
+TIMESTAMP_RESOLUTION = 1.0
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ToolEntry:
+    """An installed tool recorded for a project.
+    
+    Held as a slotted object in memory and stored on disk as a plain dict.
+    """
+    name: str
+    display_name: str = ''
+    github_url: str = ''
+    added_date: str = ''
+    added_manually: bool = False
+    detection_method: str = 'manual'
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ToolEntry':
+        """Build an entry from its stored form, ignoring unknown keys."""
+        known = {k: v for k, v in data.items() if k in _TOOL_ENTRY_FIELDS}
+        known.setdefault('name', '')
+        return cls(**known)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entry in the dict form stored on disk and handed to callers."""
+        return {
+            'name': self.name,
+            'display_name': self.display_name,
+            'github_url': self.github_url,
+            'added_date': self.added_date,
+            'added_manually': self.added_manually,
+            'detection_method': self.detection_method,
+            'metadata': self.metadata
+        }
+
+
+_TOOL_ENTRY_FIELDS = frozenset(f.name for f in fields(ToolEntry))
+
+
+# Container fields every project config carries, with the type stored
+PROJECT_CONTAINER_FIELDS = {
+    'installed_tools': dict,  # {lowercased tool name: ToolEntry}, dicts outside the manager
+    'target_tools': dict,  # {lowercased tool name: entry}
+    'manually_added_tools': list,
+    'confirmed_tools': list,
+    'excluded_tools': list,
+    'scan_history': list,
+}
+
+
+def _upgrade_project_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring a stored project config to the current shape, in place.
+    
+    Tool lists written by older versions become name-keyed dicts, missing
+    or malformed containers are replaced with empty ones and installed
+    tools become ToolEntry objects, so callers can index fields directly.
+    """
+    for name, kind in PROJECT_CONTAINER_FIELDS.items():
+        value = config.get(name)
+        if isinstance(value, kind):
+            continue
+        if kind is dict and isinstance(value, list):
+            config[name] = {t.get('name', '').lower(): t for t in value}
+        else:
+            config[name] = kind()
+    installed_tools = config['installed_tools']
+    for tool_name, entry in installed_tools.items():
+        if isinstance(entry, dict):
+            installed_tools[tool_name] = ToolEntry.from_dict(entry)
+    # Tool counts are computed by list_projects, drop copies stored by older saves
+    config.pop('installed_tools_count', None)
+    config.pop('target_tools_count', None)
+    return config
 
 
 class UserConfigManager:
@@ -14,17 +197,59 @@ class UserConfigManager:
         """Initialize config manager."""
         if config_dir is None:
             # Use user's home directory for config
-            config_dir = Path.home() / '.ai-pitfall-detector'
+            config_dir = _DEFAULT_CONFIG_DIR
         
         self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / 'user_config.json'
-        self.projects_file = self.config_dir / 'projects.json'
+        # One file per project, named by a hash of its resolved path
+        self.projects_dir = self.config_dir / 'projects'
+        # Single-file store used by older versions, migrated on first access
+        self.legacy_projects_file = self.config_dir / 'projects.json'
         
-        # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure config directories exist
+        if not self.projects_dir.is_dir():
+            self.projects_dir.mkdir(parents=True, exist_ok=True)
+        # Report directory already created by get_report_directory()
+        self._report_dir_ensured: Optional[str] = None
         
-        self._config = self._load_config()
-        self._projects = self._load_projects()
+        # Files are read on first access only
+        self._config_cache = None
+        self._projects_cache: Dict[str, Dict[str, Any]] = {}
+        self._all_projects_loaded = False
+        self._legacy_checked = False
+        
+        # Resolved project keys by the path string callers passed in
+        self._resolved_keys: Dict[str, str] = {}
+        
+        # Timestamp shared by mutations made during this run, see _now()
+        self._run_ts = datetime.now().isoformat()
+        self._run_ts_taken = time.monotonic()
+        
+        # Writes are deferred while inside batch()
+        self._batch_depth = 0
+        self._dirty_config = False
+        self._dirty_projects: Set[str] = set()
+        # Content digests of what this manager last wrote, by file
+        self._written_digests: Dict[Path, bytes] = {}
+    
+    def _now(self) -> str:
+        """Current ISO timestamp, refreshed at most once per TIMESTAMP_RESOLUTION."""
+        now = time.monotonic()
+        if now - self._run_ts_taken >= TIMESTAMP_RESOLUTION:
+            self._run_ts = datetime.now().isoformat()
+            self._run_ts_taken = now
+        return self._run_ts
+    
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """User configuration, read from disk on first access."""
+        if self._config_cache is None:
+            self._config_cache = self._load_config()
+        return self._config_cache
+    
+    @_config.setter
+    def _config(self, value: Dict[str, Any]):
+        self._config_cache = value
     
     def _load_config(self) -> Dict[str, Any]:
         """Load user configuration."""
@@ -32,23 +257,84 @@ class UserConfigManager:
             return self._get_default_config()
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(self.config_file)
         except Exception as e:
             print(f"Warning: Failed to load user config: {e}")
             return self._get_default_config()
     
+    @property
+    def _projects(self) -> Dict[str, Any]:
+        """All project configurations, read from disk on first access."""
+        if not self._all_projects_loaded:
+            loaded = self._load_projects()
+            loaded.update(self._projects_cache)
+            self._projects_cache = loaded
+            self._all_projects_loaded = True
+        return self._projects_cache
+    
+    def _project_file(self, project_key: str) -> Path:
+        """Get the file holding a single project's configuration."""
+        digest = hashlib.sha1(project_key.encode('utf-8')).hexdigest()
+        return self.projects_dir / f"{digest}.json"
+    
+    def _read_project_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Read a project file, returning its {'key', 'config'} record."""
+        try:
+            record = _read_json(path)
+            if 'last_updated' in record:
+                record['config']['last_updated'] = record.pop('last_updated')
+            return record
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Failed to load project config {path.name}: {e}")
+            return None
+    
+    def _load_project(self, project_key: str) -> Optional[Dict[str, Any]]:
+        """Load one project's configuration without touching the others."""
+        if project_key in self._projects_cache or self._all_projects_loaded:
+            return self._projects_cache.get(project_key)
+        
+        self._migrate_legacy_projects()
+        record = self._read_project_file(self._project_file(project_key))
+        if record is None:
+            return None
+        config = _upgrade_project_config(record['config'])
+        self._projects_cache[project_key] = config
+        return config
+    
     def _load_projects(self) -> Dict[str, Any]:
-        """Load project-specific configurations."""
-        if not self.projects_file.exists():
-            return {}
+        """Load every project-specific configuration."""
+        self._migrate_legacy_projects()
+        projects = {}
+        for path in self.projects_dir.glob('*.json'):
+            record = self._read_project_file(path)
+            if record is not None:
+                projects[record['key']] = _upgrade_project_config(record['config'])
+        return projects
+    
+    def _migrate_legacy_projects(self):
+        """Split an old single-file projects.json into per-project files."""
+        if self._legacy_checked:
+            return
+        self._legacy_checked = True
+        if not self.legacy_projects_file.exists():
+            return
         
         try:
-            with open(self.projects_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            legacy = _read_json(self.legacy_projects_file)
+            for project_key, config in legacy.items():
+                path = self._project_file(project_key)
+                # Written by an earlier, interrupted migration and possibly saved since
+                if path.exists():
+                    continue
+                _write_atomic(path, _json_dumps({'key': project_key, 'config': config}))
+            os.replace(
+                self.legacy_projects_file,
+                self.legacy_projects_file.with_name('projects.json.migrated')
+            )
         except Exception as e:
-            print(f"Warning: Failed to load projects config: {e}")
-            return {}
+            print(f"Warning: Failed to migrate projects config: {e}")
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default user configuration."""
@@ -58,14 +344,14 @@ class UserConfigManager:
                 'default_output_format': 'human',
                 'auto_save_reports': True,
                 'verbose_mode': False,
-                'report_directory': str(Path.home() / 'ai-pitfall-reports')
+                'report_directory': str(_DEFAULT_REPORT_DIR)
             },
             'api_keys': {
                 # Store encrypted or hashed versions in real implementation
                 'openai_api_key_set': False,
                 'anthropic_api_key_set': False
             },
-            'last_updated': datetime.now().isoformat(),
+            'last_updated': self._now(),
             'workflow_preferences': {
                 'skip_confirmation': False,
                 'auto_detect_missing': True,
@@ -73,33 +359,99 @@ class UserConfigManager:
             }
         }
     
+    @contextmanager
+    def batch(self) -> Iterator['UserConfigManager']:
+        """Defer saves until the outermost batch exits, then write each file once."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._dirty_config:
+                    self.save_config()
+                if self._dirty_projects:
+                    self.save_projects()
+    
     def save_config(self):
         """Save current configuration to file."""
+        if self._batch_depth:
+            self._dirty_config = True
+            return
+        self._dirty_config = False
         try:
-            self._config['last_updated'] = datetime.now().isoformat()
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            data = _json_dumps(_without_stamp(self._config))
+            digest = _digest(data)
+            if self._written_digests.get(self.config_file) == digest:
+                return
+            self._config['last_updated'] = self._now()
+            _write_atomic(self.config_file, _append_stamp(data, self._config['last_updated']))
+            self._written_digests[self.config_file] = digest
         except Exception as e:
             print(f"Warning: Failed to save user config: {e}")
     
     def save_projects(self):
-        """Save projects configuration to file."""
-        try:
-            with open(self.projects_file, 'w', encoding='utf-8') as f:
-                json.dump(self._projects, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Warning: Failed to save projects config: {e}")
+        """Write every project changed since the last save to its own file."""
+        if self._batch_depth:
+            return
+        dirty, self._dirty_projects = self._dirty_projects, set()
+        for project_key in dirty:
+            path = self._project_file(project_key)
+            config = self._projects_cache[project_key]
+            try:
+                # The stamp is stored next to the config so only content is digested
+                data = _json_dumps({'key': project_key, 'config': _without_stamp(config)})
+                digest = _digest(data)
+                if self._written_digests.get(path) == digest:
+                    continue
+                _write_atomic(path, _append_stamp(data, config.get('last_updated')))
+                self._written_digests[path] = digest
+            except Exception as e:
+                print(f"Warning: Failed to save projects config: {e}")
+    
+    def _key(self, project_path: str) -> str:
+        """Get the resolved path used to key a project, resolving each input once."""
+        project_key = self._resolved_keys.get(project_path)
+        if project_key is None:
+            project_key = str(Path(project_path).resolve(strict=False))
+            self._resolved_keys[project_path] = project_key
+        return project_key
     
     def get_project_config(self, project_path: str) -> Dict[str, Any]:
-        """Get configuration for a specific project."""
-        project_key = str(Path(project_path).resolve())
-        return self._projects.get(project_key, self._get_default_project_config(project_path))
+        """Get configuration for a specific project, with installed tools as plain dicts."""
+        config = self._load_project(self._key(project_path))
+        if config is None:
+            return self._get_default_project_config(project_path)
+        exported = dict(config)
+        exported['installed_tools'] = {
+            tool_name: entry.to_dict() for tool_name, entry in config['installed_tools'].items()
+        }
+        return exported
     
     def save_project_config(self, project_path: str, config: Dict[str, Any]):
         """Save configuration for a specific project."""
-        project_key = str(Path(project_path).resolve())
-        config['last_updated'] = datetime.now().isoformat()
-        self._projects[project_key] = config
+        # Upgrade a copy so the caller's dict keeps plain-dict tool entries
+        stored = dict(config)
+        if isinstance(stored.get('installed_tools'), dict):
+            stored['installed_tools'] = dict(stored['installed_tools'])
+        self._projects_cache[self._key(project_path)] = _upgrade_project_config(stored)
+        self._mark_dirty(project_path)
+    
+    def _mutable_project(self, project_path: str) -> Dict[str, Any]:
+        """Get the stored config object for a project to edit in place."""
+        project_key = self._key(project_path)
+        config = self._load_project(project_key)
+        if config is None:
+            config = self._get_default_project_config(project_path)
+            self._projects_cache[project_key] = config
+        return config
+    
+    def _mark_dirty(self, project_path: str):
+        """Record an in-place project edit and save it (deferred inside batch())."""
+        project_key = self._key(project_path)
+        config = self._projects_cache[project_key]
+        config['last_updated'] = self._now()
+        self._dirty_projects.add(project_key)
         self.save_projects()
     
     def _get_default_project_config(self, project_path: str) -> Dict[str, Any]:
@@ -107,83 +459,80 @@ class UserConfigManager:
         return {
             'project_path': project_path,
             'project_name': Path(project_path).name,
-            'installed_tools': [],
+            'installed_tools': {},
             'manually_added_tools': [],
             'last_scan_date': None,
             'confirmed_tools': [],
-            'target_tools': [],  # Tools user wants to install
+            'target_tools': {},  # Tools user wants to install
             'excluded_tools': [],  # Tools user wants to ignore
             'scan_history': [],
-            'created_date': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat()
+            'created_date': self._now(),
+            'last_updated': self._now()
         }
     
     def add_installed_tool(self, project_path: str, tool_name: str, tool_info: Dict[str, Any]):
         """Add a tool to the project's installed tools list."""
-        project_config = self.get_project_config(project_path)
-        
-        # Remove if already exists to avoid duplicates
-        project_config['installed_tools'] = [
-            t for t in project_config['installed_tools'] 
-            if t.get('name', '').lower() != tool_name.lower()
-        ]
+        project_config = self._mutable_project(project_path)
         
         # Add the tool
-        tool_entry = {
-            'name': tool_name.lower(),
-            'display_name': tool_info.get('display_name', tool_name),
-            'github_url': tool_info.get('github_url', ''),
-            'added_date': datetime.now().isoformat(),
-            'added_manually': tool_info.get('added_manually', False),
-            'detection_method': tool_info.get('detection_method', 'manual'),
-            'metadata': tool_info.get('metadata', {})
-        }
+        tool_entry = ToolEntry(
+            name=tool_name.lower(),
+            display_name=tool_info.get('display_name', tool_name),
+            github_url=tool_info.get('github_url', ''),
+            added_date=self._now(),
+            added_manually=tool_info.get('added_manually', False),
+            detection_method=tool_info.get('detection_method', 'manual'),
+            metadata=tool_info.get('metadata', {})
+        )
         
-        project_config['installed_tools'].append(tool_entry)
-        self.save_project_config(project_path, project_config)
+        # Replace any existing entry and move it to the end
+        installed_tools = project_config['installed_tools']
+        installed_tools.pop(tool_entry.name, None)
+        installed_tools[tool_entry.name] = tool_entry
+        self._mark_dirty(project_path)
     
     def add_target_tool(self, project_path: str, tool_name: str, github_url: str = ''):
         """Add a tool to the target installation list."""
-        project_config = self.get_project_config(project_path)
-        
-        # Remove if already exists
-        project_config['target_tools'] = [
-            t for t in project_config['target_tools']
-            if t.get('name', '').lower() != tool_name.lower()
-        ]
+        project_config = self._mutable_project(project_path)
         
         # Add the target tool
         target_tool = {
             'name': tool_name.lower(),
             'display_name': tool_name,
             'github_url': github_url,
-            'added_date': datetime.now().isoformat()
+            'added_date': self._now()
         }
         
-        project_config['target_tools'].append(target_tool)
-        self.save_project_config(project_path, project_config)
+        # Replace any existing entry and move it to the end
+        target_tools = project_config['target_tools']
+        target_tools.pop(target_tool['name'], None)
+        target_tools[target_tool['name']] = target_tool
+        self._mark_dirty(project_path)
     
     def get_installed_tools(self, project_path: str) -> List[Dict[str, Any]]:
         """Get list of installed tools for a project."""
-        project_config = self.get_project_config(project_path)
-        return project_config.get('installed_tools', [])
+        project_config = self._load_project(self._key(project_path))
+        if project_config is None:
+            return []
+        return [entry.to_dict() for entry in project_config['installed_tools'].values()]
     
     def get_target_tools(self, project_path: str) -> List[Dict[str, Any]]:
         """Get list of target tools for a project."""
         project_config = self.get_project_config(project_path)
-        return project_config.get('target_tools', [])
+        return list(project_config['target_tools'].values())
     
     def update_scan_history(self, project_path: str, scan_results: Dict[str, Any]):
         """Update the scan history for a project."""
-        project_config = self.get_project_config(project_path)
+        project_config = self._mutable_project(project_path)
+        detected_tools = scan_results.get('detected_ai_tools', ())
         
         scan_entry = {
-            'scan_date': datetime.now().isoformat(),
-            'tools_detected': len(scan_results.get('detected_ai_tools', [])),
-            'detection_methods': list(set([
-                method for tool in scan_results.get('detected_ai_tools', [])
-                for method in tool.get('detection_methods', [])
-            ])),
+            'scan_date': self._now(),
+            'tools_detected': len(detected_tools),
+            'detection_methods': sorted({
+                method for tool in detected_tools
+                for method in tool.get('detection_methods', ())
+            }),
             'scan_summary': {
                 'python_packages': len(scan_results.get('python_packages', {})),
                 'conda_packages': len(scan_results.get('conda_environments', {})),
@@ -194,12 +543,12 @@ class UserConfigManager:
         }
         
         # Keep only last 10 scan entries
-        scan_history = project_config.get('scan_history', [])
+        scan_history = project_config['scan_history']
         scan_history.append(scan_entry)
         project_config['scan_history'] = scan_history[-10:]
         project_config['last_scan_date'] = scan_entry['scan_date']
         
-        self.save_project_config(project_path, project_config)
+        self._mark_dirty(project_path)
     
     def set_api_key_status(self, api_key_type: str, is_set: bool):
         """Update API key status (don't store actual keys)."""
@@ -214,11 +563,13 @@ class UserConfigManager:
         """Get the directory where reports should be saved."""
         report_dir = self._config['user_preferences'].get(
             'report_directory', 
-            str(Path.home() / 'ai-pitfall-reports')
+            str(_DEFAULT_REPORT_DIR)
         )
         
-        # Ensure directory exists
-        Path(report_dir).mkdir(parents=True, exist_ok=True)
+        # Ensure directory exists, once per configured location
+        if self._report_dir_ensured != report_dir:
+            Path(report_dir).mkdir(parents=True, exist_ok=True)
+            self._report_dir_ensured = report_dir
         return report_dir
     
     def get_user_preference(self, key: str, default: Any = None) -> Any:
@@ -234,39 +585,47 @@ class UserConfigManager:
         """List all configured projects."""
         projects = []
         for project_path, config in self._projects.items():
-            projects.append({
+            last_scan = config.get('last_scan_date')
+            projects.append((last_scan or '', {
                 'project_path': project_path,
                 'project_name': config.get('project_name', Path(project_path).name),
-                'last_scan': config.get('last_scan_date'),
-                'installed_tools_count': len(config.get('installed_tools', [])),
-                'target_tools_count': len(config.get('target_tools', []))
-            })
+                'last_scan': last_scan,
+                'installed_tools_count': len(config['installed_tools']),
+                'target_tools_count': len(config['target_tools'])
+            }))
         
-        return sorted(projects, key=lambda x: x.get('last_scan') or '', reverse=True)
+        projects.sort(key=itemgetter(0), reverse=True)
+        return [summary for _, summary in projects]
     
     def cleanup_old_projects(self, max_projects: int = 20):
-        """Remove old project configurations to keep config file manageable."""
-        if len(self._projects) <= max_projects:
+        """Remove the least recently saved project files beyond max_projects."""
+        # Count projects still waiting in a legacy projects.json too
+        self._migrate_legacy_projects()
+        with os.scandir(self.projects_dir) as it:
+            files = [entry for entry in it if entry.name.endswith('.json') and entry.is_file()]
+        excess = len(files) - max_projects
+        if excess <= 0:
             return
         
-        # Sort by last updated date and keep only the most recent
-        sorted_projects = sorted(
-            self._projects.items(),
-            key=lambda x: x[1].get('last_updated', ''),
-            reverse=True
-        )
+        # File mtimes track saves, so no project file has to be parsed
+        removed = set()
+        for entry in heapq.nsmallest(excess, files, key=lambda e: e.stat().st_mtime_ns):
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+            removed.add(entry.name)
+            # A later save of identical content must not be skipped
+            self._written_digests.pop(self.projects_dir / entry.name, None)
         
-        # Keep only the most recent projects
-        self._projects = dict(sorted_projects[:max_projects])
-        self.save_projects()
-
+        # Forget cached copies of the removed projects
+        for project_key in list(self._projects_cache):
+            if self._project_file(project_key).name in removed:
+                del self._projects_cache[project_key]
+                self._dirty_projects.discard(project_key)
 
-# Global config manager instance
-_config_manager = None
 
+@lru_cache(maxsize=None)
 def get_user_config() -> UserConfigManager:
     """Get the global user config manager instance."""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = UserConfigManager()
-    return _config_manager
\ No newline at end of file
+    return UserConfigManager()
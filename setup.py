@@ -63,11 +63,15 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
             "pre-commit>=3.0.0",
         ],
+        "fast": [
+            "orjson>=3.9",
+        ],
     },
     include_package_data=True,
     zip_safe=False,
@@ -0,0 +1,34 @@
+"""Shared test fixtures."""
+
+import pytest
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_network():
+    """Keep the suite off the network: every socket reports its port as closed.
+
+    Tests that need other socket behaviour patch it locally on top of this.
+    """
+    sock = MagicMock()
+    sock.__enter__.return_value = sock
+    sock.connect_ex.return_value = 1
+    with patch('socket.socket', return_value=sock):
+        yield
+
+
+@pytest.fixture(scope="session")
+def repo_info_payload():
+    """Read-only GitHub /repos/{owner}/{repo} response body; copy with dict() to mutate."""
+    return MappingProxyType({
+        'name': 'test-repo',
+        'full_name': 'owner/test-repo',
+        'description': 'A test repository',
+        'language': 'Python',
+        'stargazers_count': 100,
+        'forks_count': 20,
+        'topics': ['ai', 'ml'],
+        'html_url': 'https://github.com/owner/test-repo',
+        'private': False
+    })
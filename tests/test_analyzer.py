@@ -5,14 +5,21 @@ from unittest.mock import Mock, patch, MagicMock
 from pitfall_detector.analyzer import ConflictAnalyzer, ConflictTypes, Severity
 
 
+@pytest.fixture(scope="class")
+def analyzer():
+    """Build one analyzer with a mocked OpenAI client for the whole class."""
+    with patch('pitfall_detector.analyzer.openai.OpenAI'):
+        with patch('pitfall_detector.config.config.get_api_key', return_value='test-key'):
+            return ConflictAnalyzer()
+
+
 class TestConflictAnalyzer:
     """Test the ConflictAnalyzer class."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        with patch('pitfall_detector.analyzer.openai.OpenAI'):
-            with patch('pitfall_detector.config.config.get_api_key', return_value='test-key'):
-                self.analyzer = ConflictAnalyzer()
+    @pytest.fixture(autouse=True)
+    def _analyzer(self, analyzer):
+        """Share the class-scoped analyzer with each test."""
+        self.analyzer = analyzer
     
     def test_analyze_single_tool(self):
         """Test analysis with only one tool (should return no conflicts)."""
@@ -1,30 +1,24 @@
 """Tests for configuration management."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
-from unittest.mock import patch
 from pitfall_detector.config import Config
 
 
 class TestConfig:
     """Test the Config class."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        # Create temporary directory for testing
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def _config(self, tmp_path, monkeypatch):
+        """Set up a Config that reads and writes only under tmp_path."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        monkeypatch.setenv('USERPROFILE', str(tmp_path))
+        self.temp_dir = tmp_path
         self.config = Config()
         # Override config directory for testing
         self.config.config_dir = self.temp_dir
         self.config.config_file = self.temp_dir / 'config.yaml'
         self.config.tools_file = self.temp_dir / 'tools.yaml'
     
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_default_config_creation(self):
         """Test that default configuration is created."""
         config_data = self.config._create_default_config()
@@ -47,9 +41,9 @@ class TestConfig:
         self.config.set('new.nested.value', 'test')
         assert self.config.get('new.nested.value') == 'test'
     
-    @patch.dict('os.environ', {'OPENAI_API_KEY': 'test-openai-key'})
-    def test_get_api_key_from_env(self):
+    def test_get_api_key_from_env(self, monkeypatch):
         """Test getting API key from environment variable."""
+        monkeypatch.setenv('OPENAI_API_KEY', 'test-openai-key')
         self.config._config = {'api': {'provider': 'openai', 'api_key': None}}
         api_key = self.config.get_api_key()
         assert api_key == 'test-openai-key'
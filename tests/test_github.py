@@ -1,8 +1,15 @@
 """Tests for GitHub integration."""
 
+import base64
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from pitfall_detector.github import GitHubClient, ToolExtractor
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from pitfall_detector.github import (
+    CATEGORY_KEYWORDS, GitHubClient, ToolExtractor, _parse_github_url_cached
+)
+
+_README_TEXT = "# Test README\nThis is a test."
+_README_B64 = base64.b64encode(_README_TEXT.encode('utf-8')).decode('utf-8')
 
 
 class TestGitHubClient:
@@ -12,79 +19,59 @@ class TestGitHubClient:
         """Set up test environment."""
         self.client = GitHubClient()
     
-    def test_parse_github_url_standard(self):
+    @pytest.mark.parametrize("url,expected", [
+        ("https://github.com/owner/repo", ("owner", "repo")),
+        ("https://github.com/owner/repo.git", ("owner", "repo")),
+        ("github.com/owner/repo", ("owner", "repo")),
+        ("github.com/owner/repo/", ("owner", "repo")),
+    ])
+    def test_parse_github_url_standard(self, url, expected):
         """Test parsing standard GitHub URLs."""
-        test_cases = [
-            ("https://github.com/owner/repo", ("owner", "repo")),
-            ("https://github.com/owner/repo.git", ("owner", "repo")),
-            ("github.com/owner/repo", ("owner", "repo")),
-            ("github.com/owner/repo/", ("owner", "repo")),
-        ]
-        
-        for url, expected in test_cases:
-            result = self.client.parse_github_url(url)
-            assert result == expected
-    
-    def test_parse_github_url_invalid(self):
+        assert self.client.parse_github_url(url) == expected
+    
+    @pytest.mark.parametrize("url", [
+        "not-a-url",
+        "https://gitlab.com/owner/repo",
+        "https://github.com/owner",
+        "",
+    ])
+    def test_parse_github_url_invalid(self, url):
         """Test parsing invalid GitHub URLs."""
-        invalid_urls = [
-            "not-a-url",
-            "https://gitlab.com/owner/repo",
-            "https://github.com/owner",
-            "",
-        ]
-        
-        for url in invalid_urls:
-            result = self.client.parse_github_url(url)
-            assert result is None
+        assert self.client.parse_github_url(url) is None
+    
+    def test_parse_github_url_cached(self):
+        """Test that repeated URLs are served from the parse cache."""
+        url = "https://github.com/cache-owner/cache-repo"
+        self.client.parse_github_url(url)
+        hits = _parse_github_url_cached.cache_info().hits
+        
+        assert self.client.parse_github_url(url) == ("cache-owner", "cache-repo")
+        assert _parse_github_url_cached.cache_info().hits == hits + 1
     
     @patch('requests.Session.get')
     def test_get_readme_success(self, mock_get):
         """Test successful README fetching."""
-        import base64
-        
         # Mock successful response
-        readme_content = "# Test README\nThis is a test."
-        encoded_content = base64.b64encode(readme_content.encode('utf-8')).decode('utf-8')
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'content': encoded_content,
-            'encoding': 'base64'
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(
+            status_code=200,
+            json=lambda: {'content': _README_B64, 'encoding': 'base64'}
+        )
         
         result = self.client.get_readme("owner", "repo")
-        assert result == readme_content
+        assert result == _README_TEXT
     
     @patch('requests.Session.get')
     def test_get_readme_not_found(self, mock_get):
         """Test README not found."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(status_code=404)
         
         result = self.client.get_readme("owner", "repo")
         assert result is None
     
     @patch('requests.Session.get')
-    def test_get_repo_info_success(self, mock_get):
+    def test_get_repo_info_success(self, mock_get, repo_info_payload):
         """Test successful repository info fetching."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'name': 'test-repo',
-            'full_name': 'owner/test-repo',
-            'description': 'A test repository',
-            'language': 'Python',
-            'stargazers_count': 100,
-            'forks_count': 20,
-            'topics': ['ai', 'ml'],
-            'html_url': 'https://github.com/owner/test-repo',
-            'private': False
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(status_code=200, json=lambda: repo_info_payload)
         
         result = self.client.get_repo_info("owner", "test-repo")
         
@@ -96,9 +83,7 @@ class TestGitHubClient:
     @patch('requests.Session.get')
     def test_get_repo_info_not_found(self, mock_get):
         """Test repository not found."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(status_code=404)
         
         result = self.client.get_repo_info("owner", "nonexistent")
         assert result is None
@@ -110,15 +95,28 @@ class TestGitHubClient:
         assert "Invalid GitHub URL format" in error
 
 
+@pytest.fixture(scope="session")
+def _gh_client_spec():
+    """Introspect GitHubClient's attributes once for every spec'd mock."""
+    return dir(GitHubClient)
+
+
+@pytest.fixture
+def gh_mock(_gh_client_spec):
+    """A fresh GitHubClient mock; copying a template would share its child mocks."""
+    return Mock(spec=_gh_client_spec)
+
+
+@pytest.fixture
+def extractor(gh_mock):
+    """A ToolExtractor wired to the mocked client."""
+    return ToolExtractor(gh_mock)
+
+
 class TestToolExtractor:
     """Test the ToolExtractor class."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.github_client = Mock(spec=GitHubClient)
-        self.extractor = ToolExtractor(self.github_client)
-    
-    def test_extract_metadata_pip_install(self):
+    def test_extract_metadata_pip_install(self, extractor):
         """Test metadata extraction for pip installation."""
         readme_content = """
         # Test Tool
@@ -132,32 +130,45 @@ class TestToolExtractor:
         Set OPENAI_API_KEY environment variable.
         """
         
-        metadata = self.extractor._extract_metadata(readme_content)
+        metadata = extractor._extract_metadata(readme_content)
         
         assert 'pip' in metadata['installation_methods']
         assert 8000 in metadata['ports']
         assert 'OPENAI_API_KEY' in metadata['environment_vars']
     
-    def test_extract_metadata_categorization(self):
+    @pytest.mark.parametrize("content,expected_categories", [
+        ("This is an agent framework for multi-agent systems", ['agent-framework']),
+        ("LLM interface for GPT models", ['llm-interface']),
+        ("RAG tool with vector embeddings", ['rag-tool']),
+        ("Memory management for conversations", ['memory-management']),
+        ("Streamlit web interface", ['web-interface']),
+    ])
+    def test_extract_metadata_categorization(self, extractor, content, expected_categories):
         """Test tool categorization."""
-        test_cases = [
-            ("This is an agent framework for multi-agent systems", ['agent-framework']),
-            ("LLM interface for GPT models", ['llm-interface']),
-            ("RAG tool with vector embeddings", ['rag-tool']),
-            ("Memory management for conversations", ['memory-management']),
-            ("Streamlit web interface", ['web-interface']),
-        ]
-        
-        for content, expected_categories in test_cases:
-            metadata = self.extractor._extract_metadata(content)
-            for category in expected_categories:
-                assert category in metadata['categories']
-    
-    def test_extract_tool_info_success(self):
+        metadata = extractor._extract_metadata(content)
+        for category in expected_categories:
+            assert category in metadata['categories']
+    
+    def test_extract_metadata_overlapping_category_keywords(self, extractor):
+        """Test that overlapping keywords all categorize, in a fixed order."""
+        metadata = extractor._extract_metadata("RAGent toolkit")
+        
+        assert metadata['categories'] == ['agent-framework', 'rag-tool']
+    
+    def test_category_keywords_not_prefixes_across_categories(self):
+        """Test that no keyword shadows another category's keyword at the same position."""
+        keywords = [(word, category) for category, words in CATEGORY_KEYWORDS.items() for word in words]
+        
+        for word, category in keywords:
+            for other, other_category in keywords:
+                if category != other_category:
+                    assert not other.startswith(word), (word, other)
+    
+    def test_extract_tool_info_success(self, extractor, gh_mock):
         """Test successful tool information extraction."""
         # Mock GitHub client responses
-        self.github_client.parse_github_url.return_value = ("owner", "repo")
-        self.github_client.get_repo_info.return_value = {
+        gh_mock.parse_github_url.return_value = ("owner", "repo")
+        gh_mock.get_repo_info.return_value = {
             'name': 'test-tool',
             'full_name': 'owner/test-tool',
             'description': 'A test tool',
@@ -165,9 +176,9 @@ class TestToolExtractor:
             'stars': 50,
             'topics': ['ai']
         }
-        self.github_client.get_readme.return_value = "# Test Tool\npip install test-tool"
+        gh_mock.get_readme.return_value = "# Test Tool\npip install test-tool"
         
-        result = self.extractor.extract_tool_info("https://github.com/owner/repo")
+        result = extractor.extract_tool_info("https://github.com/owner/repo")
         
         assert result['name'] == 'test-tool'
         assert result['description'] == 'A test tool'
@@ -175,17 +186,17 @@ class TestToolExtractor:
         assert result['stars'] == 50
         assert 'metadata' in result
     
-    def test_extract_tool_info_invalid_url(self):
+    def test_extract_tool_info_invalid_url(self, extractor, gh_mock):
         """Test tool extraction with invalid URL."""
-        self.github_client.parse_github_url.return_value = None
+        gh_mock.parse_github_url.return_value = None
         
         with pytest.raises(ValueError, match="Invalid GitHub URL"):
-            self.extractor.extract_tool_info("invalid-url")
+            extractor.extract_tool_info("invalid-url")
     
-    def test_extract_tool_info_repo_not_found(self):
+    def test_extract_tool_info_repo_not_found(self, extractor, gh_mock):
         """Test tool extraction when repository is not found."""
-        self.github_client.parse_github_url.return_value = ("owner", "repo")
-        self.github_client.get_repo_info.return_value = None
+        gh_mock.parse_github_url.return_value = ("owner", "repo")
+        gh_mock.get_repo_info.return_value = None
         
         with pytest.raises(Exception, match="Repository .* not found"):
-            self.extractor.extract_tool_info("https://github.com/owner/repo")
\ No newline at end of file
+            extractor.extract_tool_info("https://github.com/owner/repo")
\ No newline at end of file
@@ -1,7 +1,45 @@
 """Tests for static conflict rules."""
 
+import copy
 import pytest
-from pitfall_detector.static_rules import StaticConflictDetector
+from types import MappingProxyType
+from pitfall_detector import static_rules
+from pitfall_detector.static_rules import (
+    ConflictRecord, PortConflictRecord, StaticConflictDetector, _KeywordIndex
+)
+
+# Canonical tool inputs shared by the tests; use _tools() to get mutable copies
+_BASE_TOOLS = MappingProxyType({
+    'streamlit': {
+        'name': 'streamlit',
+        'metadata': {'ports': [8501], 'categories': ['web-interface'], 'environment_vars': []}
+    },
+    'gradio': {
+        'name': 'gradio',
+        'metadata': {'ports': [7860], 'categories': ['web-interface'], 'environment_vars': []}
+    },
+    'crewai': {
+        'name': 'crewai',
+        'metadata': {'ports': [], 'categories': ['agent-framework'], 'environment_vars': []}
+    },
+    'autogen': {
+        'name': 'autogen',
+        'metadata': {'ports': [], 'categories': ['agent-framework'], 'environment_vars': []}
+    },
+    'tensorflow': {
+        'name': 'tensorflow',
+        'metadata': {'ports': [], 'categories': ['ml-framework'], 'environment_vars': []}
+    },
+    'requests': {
+        'name': 'requests',
+        'metadata': {'ports': [], 'categories': ['http-client'], 'environment_vars': []}
+    },
+})
+
+
+def _tools(*names):
+    """Return deep copies of the named canonical tools, in order."""
+    return [copy.deepcopy(_BASE_TOOLS[name]) for name in names]
 
 
 class TestStaticConflictDetector:
@@ -32,6 +70,31 @@ class TestStaticConflictDetector:
         assert set(conflicts[0]['tools_involved']) == {'streamlit', 'custom-app'}
         assert '8501' in conflicts[0]['description']
     
+    def test_detect_multi_tool_port_conflict(self):
+        """Test that three tools on one port produce a single conflict."""
+        tools = [
+            {'name': 'app-one', 'metadata': {'ports': [9000]}},
+            {'name': 'app-two', 'metadata': {'ports': [9000]}},
+            {'name': 'app-three', 'metadata': {'ports': [9000]}}
+        ]
+        
+        conflicts = self.detector.detect_port_conflicts(tools)
+        
+        assert len(conflicts) == 1
+        assert conflicts[0]['tools_involved'] == ['app-one', 'app-two', 'app-three']
+        assert conflicts[0]['description'] == '3 tools use port 9000'
+    
+    def test_port_conflicts_need_distinct_tools(self):
+        """Test that a port only conflicts when claimed by two different tools."""
+        repeated = [{'name': 'app-one', 'metadata': {'ports': [9100, 9100]}}]
+        same_tool = [
+            {'name': 'app-one', 'metadata': {'ports': [9100]}},
+            {'name': 'App-One', 'metadata': {'ports': [9100]}}
+        ]
+        
+        assert self.detector.detect_port_conflicts(repeated) == []
+        assert self.detector.detect_port_conflicts(same_tool) == []
+    
     def test_detect_known_tool_ports(self):
         """Test detection using known tool ports."""
         tools = [
@@ -75,16 +138,7 @@ class TestStaticConflictDetector:
     
     def test_detect_functional_overlaps(self):
         """Test functional overlap detection."""
-        tools = [
-            {
-                'name': 'crewai',
-                'metadata': {'categories': ['agent-framework']}
-            },
-            {
-                'name': 'autogen',
-                'metadata': {'categories': ['agent-framework']}
-            }
-        ]
+        tools = _tools('crewai', 'autogen')
         
         conflicts = self.detector.detect_functional_overlaps(tools)
         
@@ -94,24 +148,8 @@ class TestStaticConflictDetector:
     
     def test_detect_all_static_conflicts(self):
         """Test comprehensive static conflict detection."""
-        tools = [
-            {
-                'name': 'streamlit',
-                'metadata': {
-                    'ports': [8501],
-                    'categories': ['web-interface'],
-                    'environment_vars': []
-                }
-            },
-            {
-                'name': 'gradio',
-                'metadata': {
-                    'ports': [8501],  # Port conflict
-                    'categories': ['web-interface'],  # Functional overlap
-                    'environment_vars': []
-                }
-            }
-        ]
+        tools = _tools('streamlit', 'gradio')  # Functional overlap
+        tools[1]['metadata']['ports'] = [8501]  # Port conflict
         
         conflicts = self.detector.detect_all_static_conflicts(tools)
         
@@ -122,41 +160,72 @@ class TestStaticConflictDetector:
         assert 'port_conflict' in conflict_types
         assert 'functionality_overlap' in conflict_types
     
+    def test_detect_all_static_records(self):
+        """Test that records convert to the same dicts as the dict API."""
+        tools = _tools('streamlit', 'gradio')
+        tools[1]['metadata']['ports'] = [8501]
+        
+        records = self.detector.detect_all_static_records(tools)
+        
+        assert all(isinstance(record, ConflictRecord) for record in records)
+        assert records[0].source == 'static_rule'
+        assert [record.to_dict() for record in records] == self.detector.detect_all_static_conflicts(tools)
+    
+    def test_conflict_records_require_their_fields(self):
+        """Test that the base record is abstract and subclass fields are required."""
+        common = {'type': 'port_conflict', 'severity': 'high', 'tools_involved': ['a', 'b'], 'confidence': 'high'}
+        
+        with pytest.raises(TypeError):
+            ConflictRecord(**common)
+        with pytest.raises(TypeError):
+            PortConflictRecord(**common)
+        record = PortConflictRecord(**common, port=8501)
+        assert record.description == 'Both tools use port 8501'
+        assert record.potential_issues == 'Cannot run both tools simultaneously on port 8501'
+    
+    def test_module_functions_match_detector(self):
+        """Test that the class shim forwards to the module-level detectors."""
+        tools = _tools('crewai', 'autogen')
+        
+        assert static_rules.detect_all_static_conflicts(tools) == self.detector.detect_all_static_conflicts(tools)
+    
     def test_no_conflicts_different_tools(self):
         """Test that different tools with no conflicts are handled correctly."""
-        tools = [
-            {
-                'name': 'tensorflow',
-                'metadata': {
-                    'ports': [],
-                    'categories': ['ml-framework'],
-                    'environment_vars': []
-                }
-            },
-            {
-                'name': 'requests',
-                'metadata': {
-                    'ports': [],
-                    'categories': ['http-client'],
-                    'environment_vars': []
-                }
-            }
-        ]
+        tools = _tools('tensorflow', 'requests')
         
         conflicts = self.detector.detect_all_static_conflicts(tools)
         assert len(conflicts) == 0
     
     def test_single_tool_no_conflicts(self):
         """Test that a single tool generates no conflicts."""
-        tools = [
-            {
-                'name': 'streamlit',
-                'metadata': {
-                    'ports': [8501],
-                    'categories': ['web-interface']
-                }
-            }
-        ]
+        tools = _tools('streamlit')
         
         conflicts = self.detector.detect_all_static_conflicts(tools)
-        assert len(conflicts) == 0
\ No newline at end of file
+        assert len(conflicts) == 0
+    
+    def test_rule_tables_loaded_on_demand(self):
+        """Test that rule tables are exposed lazily as module attributes."""
+        assert 'streamlit' in static_rules.KNOWN_AI_TOOLS
+        assert static_rules.KNOWN_TOOL_PORTS['streamlit'] == (8501,)
+        
+        with pytest.raises(AttributeError):
+            static_rules.NOT_A_RULE_TABLE
+
+
+class TestKeywordIndex:
+    """Test the single-pass keyword matcher used by the detectors."""
+    
+    def test_overlapping_keywords(self):
+        """Test that keywords sharing a start position are all matched."""
+        index = _KeywordIndex({'a': ['lang'], 'b': ['langchain'], 'c': ['chain']})
+        
+        assert index.rules_in('langchain-community') == {'a', 'b', 'c'}
+        assert index.rules_in('mylang') == {'a'}
+        assert index.rules_in('other') == set()
+    
+    def test_rules_containing(self):
+        """Test reverse matching of names that are part of a keyword."""
+        index = _KeywordIndex({'a': ['langchain'], 'b': ['openai']})
+        
+        assert index.rules_containing('chain') == {'a'}
+        assert index.rules_containing('anthropic') == set()
@@ -0,0 +1,100 @@
+"""Tests for the tools database loader."""
+
+import os
+import pytest
+from unittest.mock import patch
+import yaml
+from pitfall_detector.tools_database_loader import ToolsDatabaseLoader, _load_yaml_sections
+
+
+class TestToolsDatabaseLoader:
+    """Test the ToolsDatabaseLoader class."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.db = ToolsDatabaseLoader()
+
+    def test_get_tool_case_insensitive(self):
+        """Test that tool lookups ignore case."""
+        assert self.db.get_tool('OpenAI') is self.db.get_tool('openai')
+        assert self.db.get_tool('nonexistent-tool') is None
+
+    def test_lookup_caches_cleared_on_reload(self):
+        """Test that reloading the database invalidates lookup caches."""
+        self.db.get_tool('streamlit')
+        self.db.get_installation_command('streamlit')
+        self.db.get_documentation_url('streamlit')
+        assert self.db._tool_cache.cache_info().currsize == 1
+
+        self.db._load_database()
+
+        assert self.db._tool_cache.cache_info().currsize == 0
+        assert self.db._installation_command_cache.cache_info().currsize == 0
+        assert self.db._documentation_url_cache.cache_info().currsize == 0
+
+    def test_database_loaded_lazily(self, tmp_path):
+        """Test that the YAML file is only read on first access."""
+        db = ToolsDatabaseLoader(tmp_path / 'missing.yaml')
+        assert db._database is None
+
+        with pytest.raises(Exception, match='Failed to load tools database'):
+            db.get_all_tools()
+
+    def test_sections_reset_on_reload(self, tmp_path):
+        """Test that cached sections reflect the reloaded file."""
+        database_file = tmp_path / 'tools.yaml'
+        database_file.write_text("port_conflicts:\n  web: [8501]\n", encoding='utf-8')
+        db = ToolsDatabaseLoader(database_file)
+        assert db.get_port_conflicts() == {'web': [8501]}
+
+        database_file.write_text("port_conflicts:\n  web: [7860]\n", encoding='utf-8')
+        db._load_database()
+
+        assert db.get_port_conflicts() == {'web': [7860]}
+
+    def test_snapshot_used_when_fresh(self, tmp_path):
+        """Test that a fresh pickled snapshot replaces YAML parsing."""
+        database_file = tmp_path / 'tools.yaml'
+        database_file.write_text("tools:\n  demo:\n    name: Demo\n", encoding='utf-8')
+        os.utime(database_file, (0, 0))
+
+        assert ToolsDatabaseLoader(database_file).get_tool('demo') == {'name': 'Demo'}
+        assert (tmp_path / 'tools.yaml.pkl').exists()
+
+        with patch('pitfall_detector.tools_database_loader._load_yaml_sections') as mock_load:
+            assert ToolsDatabaseLoader(database_file).get_tool('demo') == {'name': 'Demo'}
+            mock_load.assert_not_called()
+
+    def test_validate_database(self, tmp_path):
+        """Test that structural issues are reported in a stable order."""
+        database_file = tmp_path / 'tools.yaml'
+        database_file.write_text(
+            "categories:\n  web-interface: Web UIs\n"
+            "tools:\n"
+            "  good:\n    name: Good\n    description: ok\n    category: web-interface\n"
+            "  bad:\n    category: unknown\n",
+            encoding='utf-8'
+        )
+
+        issues = ToolsDatabaseLoader(database_file).validate_database()
+
+        assert issues == [
+            "Tool 'bad' missing required field: name",
+            "Tool 'bad' missing required field: description",
+            "Tool 'bad' has invalid category: unknown",
+        ]
+        assert self.db.validate_database() == []
+
+    def test_search_tools(self):
+        """Test searching by name, description and category."""
+        assert ('streamlit', self.db.get_tool('streamlit')) in self.db.search_tools('StreamLit')
+        by_category = [name for name, _ in self.db.search_tools('agent-framework')]
+        assert 'crewai' in by_category
+        assert self.db.search_tools('no-such-tool-anywhere') == []
+
+    def test_load_yaml_sections_matches_safe_load(self):
+        """Test that section-wise parsing yields the same data as safe_load."""
+        with open(self.db.database_path, 'r', encoding='utf-8') as f:
+            expected = yaml.safe_load(f)
+        with open(self.db.database_path, 'r', encoding='utf-8') as f:
+            assert _load_yaml_sections(f) == expected
@@ -0,0 +1,385 @@
+"""Tests for user configuration management."""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+from pitfall_detector import user_config
+from pitfall_detector.user_config import UserConfigManager
+
+
+class TestUserConfigManager:
+    """Test the UserConfigManager class."""
+
+    def test_config_round_trip(self, tmp_path):
+        """Test that configuration and projects survive a reload."""
+        manager = UserConfigManager(tmp_path)
+        manager.set_user_preference('theme', 'dark')
+        manager.add_installed_tool(str(tmp_path), 'Streamlit', {'detection_method': 'pip'})
+
+        reloaded = UserConfigManager(tmp_path)
+
+        assert reloaded.get_user_preference('theme') == 'dark'
+        installed = reloaded.get_installed_tools(str(tmp_path))
+        assert [t['name'] for t in installed] == ['streamlit']
+        assert installed[0]['detection_method'] == 'pip'
+
+    def test_files_written_as_indented_json(self, tmp_path):
+        """Test that saved files stay human-readable JSON."""
+        manager = UserConfigManager(tmp_path)
+        manager.set_user_preference('name', 'café')
+
+        text = (tmp_path / 'user_config.json').read_text(encoding='utf-8')
+
+        assert json.loads(text)['user_preferences']['name'] == 'café'
+        assert '\n  "' in text
+
+    def test_stdlib_fallback(self, tmp_path):
+        """Test that the stdlib json fallback reads what it writes."""
+        with patch.object(user_config, 'HAVE_ORJSON', False):
+            manager = UserConfigManager(tmp_path)
+            manager.set_user_preference('theme', 'light')
+            assert UserConfigManager(tmp_path).get_user_preference('theme') == 'light'
+
+    def test_files_loaded_lazily(self, tmp_path):
+        """Test that config files are only read when first needed."""
+        with patch.object(UserConfigManager, '_load_projects', return_value={}) as mock_load:
+            manager = UserConfigManager(tmp_path)
+            mock_load.assert_not_called()
+
+            manager.list_projects()
+            manager.list_projects()
+
+            mock_load.assert_called_once()
+
+    def test_batch_writes_once(self, tmp_path):
+        """Test that mutations inside batch() are flushed in a single write."""
+        manager = UserConfigManager(tmp_path)
+
+        with patch.object(user_config, '_write_atomic', wraps=user_config._write_atomic) as mock_write:
+            with manager.batch():
+                for name in ('streamlit', 'gradio', 'crewai'):
+                    manager.add_installed_tool(str(tmp_path), name, {})
+                assert not any((tmp_path / 'projects').iterdir())
+
+            assert mock_write.call_count == 1
+
+        installed = UserConfigManager(tmp_path).get_installed_tools(str(tmp_path))
+        assert [t['name'] for t in installed] == ['streamlit', 'gradio', 'crewai']
+
+    def test_failed_save_keeps_previous_file(self, tmp_path):
+        """Test that an interrupted save leaves the old file intact and no temp files."""
+        manager = UserConfigManager(tmp_path)
+        manager.set_user_preference('theme', 'dark')
+
+        with patch.object(user_config.os, 'replace', side_effect=OSError('disk full')):
+            manager.set_user_preference('theme', 'light')
+
+        assert UserConfigManager(tmp_path).get_user_preference('theme') == 'dark'
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['projects', 'user_config.json']
+
+    def test_projects_stored_one_file_each(self, tmp_path):
+        """Test that saving one project only writes that project's file."""
+        manager = UserConfigManager(tmp_path)
+        first, second = tmp_path / 'first', tmp_path / 'second'
+        manager.add_target_tool(str(first), 'streamlit')
+        manager.add_target_tool(str(second), 'gradio')
+        assert len(list((tmp_path / 'projects').iterdir())) == 2
+
+        with patch.object(user_config, '_write_atomic') as mock_write:
+            manager.add_target_tool(str(first), 'crewai')
+        assert mock_write.call_count == 1
+
+        reloaded = UserConfigManager(tmp_path)
+        assert [t['name'] for t in reloaded.get_target_tools(str(second))] == ['gradio']
+        assert {p['project_path'] for p in reloaded.list_projects()} == {str(first), str(second)}
+
+    def test_legacy_projects_file_migrated(self, tmp_path):
+        """Test that an old single-file projects.json is split on first access."""
+        project_key = str((tmp_path / 'old').resolve())
+        legacy = {project_key: {'project_name': 'old', 'target_tools': [{'name': 'gradio'}]}}
+        (tmp_path / 'projects.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+        manager = UserConfigManager(tmp_path)
+
+        assert manager.get_target_tools(project_key) == [{'name': 'gradio'}]
+        assert not (tmp_path / 'projects.json').exists()
+        assert (tmp_path / 'projects.json.migrated').exists()
+
+    def test_legacy_migration_keeps_newer_project_files(self, tmp_path):
+        """Test that rerunning an interrupted migration leaves existing project files alone."""
+        project_key = str((tmp_path / 'old').resolve())
+        legacy = {project_key: {'project_name': 'old', 'target_tools': [{'name': 'gradio'}]}}
+        (tmp_path / 'projects.json').write_text(json.dumps(legacy), encoding='utf-8')
+        UserConfigManager(tmp_path).add_target_tool(project_key, 'streamlit')
+        # Simulate a migration that failed before renaming projects.json
+        (tmp_path / 'projects.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+        manager = UserConfigManager(tmp_path)
+
+        assert [t['name'] for t in manager.get_target_tools(project_key)] == ['gradio', 'streamlit']
+
+    def test_cleanup_old_projects(self, tmp_path):
+        """Test that only the most recently saved projects are kept."""
+        manager = UserConfigManager(tmp_path)
+        for i in range(3):
+            manager.add_target_tool(str(tmp_path / f'p{i}'), 'gradio')
+            os.utime(manager._project_file(manager._key(str(tmp_path / f'p{i}'))), (i, i))
+
+        manager.cleanup_old_projects(max_projects=2)
+
+        assert {p['project_path'] for p in manager.list_projects()} == {
+            str(tmp_path / 'p1'), str(tmp_path / 'p2')
+        }
+
+        remaining = {p['project_path'] for p in UserConfigManager(tmp_path).list_projects()}
+        assert remaining == {str(tmp_path / 'p1'), str(tmp_path / 'p2')}
+
+    def test_cleanup_forgets_written_digests(self, tmp_path):
+        """Test that a removed project saved again with the same content is rewritten."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path / 'p0')
+        manager.add_target_tool(project, 'gradio')
+        manager.add_target_tool(str(tmp_path / 'p1'), 'gradio')
+        os.utime(manager._project_file(manager._key(project)), (0, 0))
+        manager.cleanup_old_projects(max_projects=1)
+
+        with patch.object(manager, '_now', return_value=manager._now()):
+            manager.add_target_tool(project, 'gradio')
+
+        assert manager._project_file(manager._key(project)).exists()
+
+    def test_cleanup_counts_legacy_projects(self, tmp_path):
+        """Test that projects still in a legacy projects.json count toward the limit."""
+        legacy = {str(tmp_path / f'old{i}'): {'project_name': f'old{i}'} for i in range(3)}
+        (tmp_path / 'projects.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+        UserConfigManager(tmp_path).cleanup_old_projects(max_projects=2)
+
+        assert len(list((tmp_path / 'projects').glob('*.json'))) == 2
+
+    @pytest.mark.skipif(not user_config.HAVE_ORJSON, reason="orjson not installed")
+    def test_large_file_read_through_mmap(self, tmp_path):
+        """Test that files above the mmap threshold parse identically."""
+        payload = {'history': ['x' * 100] * 100}
+        path = tmp_path / 'big.json'
+        path.write_bytes(user_config._json_dumps(payload))
+        assert path.stat().st_size >= user_config.MMAP_MIN_SIZE
+
+        with patch.object(user_config.mmap, 'mmap', wraps=user_config.mmap.mmap) as mock_mmap:
+            assert user_config._read_json(path) == payload
+        mock_mmap.assert_called_once()
+
+    def test_tools_keyed_by_name(self, tmp_path):
+        """Test that re-adding a tool replaces it and moves it to the end."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        for name in ('Streamlit', 'gradio', 'streamlit'):
+            manager.add_target_tool(project, name)
+
+        assert [t['name'] for t in manager.get_target_tools(project)] == ['gradio', 'streamlit']
+        assert set(manager.get_project_config(project)['target_tools']) == {'gradio', 'streamlit'}
+
+    def test_tool_lists_upgraded_on_load(self, tmp_path):
+        """Test that list-shaped tool fields from older versions become dicts."""
+        manager = UserConfigManager(tmp_path)
+        project_key = str(tmp_path.resolve())
+        record = {'key': project_key, 'config': {'installed_tools': [{'name': 'CrewAI'}], 'target_tools': []}}
+        manager._project_file(project_key).write_text(json.dumps(record), encoding='utf-8')
+
+        config = manager.get_project_config(project_key)
+
+        assert config['installed_tools'] == {'crewai': user_config.ToolEntry(name='CrewAI').to_dict()}
+        assert config['target_tools'] == {}
+
+    def test_list_projects_summary(self, tmp_path):
+        """Test that project summaries carry tool counts, newest scan first."""
+        manager = UserConfigManager(tmp_path)
+        older, newer, never = (str(tmp_path / name) for name in ('older', 'newer', 'never'))
+        manager.add_target_tool(older, 'gradio')
+        manager.add_target_tool(older, 'streamlit')
+        manager.add_installed_tool(newer, 'crewai', {})
+        manager.add_target_tool(never, 'autogen')
+        for path, scan_date in ((older, '2024-01-01T00:00:00'), (newer, '2024-02-01T00:00:00')):
+            config = manager.get_project_config(path)
+            config['last_scan_date'] = scan_date
+            manager.save_project_config(path, config)
+
+        projects = UserConfigManager(tmp_path).list_projects()
+
+        assert [p['project_path'] for p in projects] == [newer, older, never]
+        assert projects[1]['target_tools_count'] == 2
+        assert projects[0]['installed_tools_count'] == 1
+        assert projects[2]['last_scan'] is None
+
+    def test_timestamps_shared_within_run(self, tmp_path):
+        """Test that mutations close together share one timestamp until it goes stale."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        manager.add_target_tool(project, 'gradio')
+        manager.add_target_tool(project, 'streamlit')
+        first, second = manager.get_target_tools(project)
+        assert first['added_date'] == second['added_date']
+
+        manager._run_ts_taken -= user_config.TIMESTAMP_RESOLUTION
+        manager._run_ts = 'stale'
+        assert manager._now() != 'stale'
+
+    def test_update_scan_history(self, tmp_path):
+        """Test that scan entries dedupe detection methods and keep the last 10."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        scan_results = {'detected_ai_tools': [
+            {'detection_methods': ['pip', 'process']},
+            {'detection_methods': ['config', 'pip']},
+            {},
+        ]}
+        for _ in range(12):
+            manager.update_scan_history(project, scan_results)
+
+        history = manager.get_project_config(project)['scan_history']
+        assert len(history) == 10
+        assert history[-1]['tools_detected'] == 3
+        assert history[-1]['detection_methods'] == ['config', 'pip', 'process']
+
+    def test_project_key_resolved_once(self, tmp_path):
+        """Test that each project path string is only resolved once."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path / 'sub' / '..' / 'proj')
+
+        with patch.object(user_config.Path, 'resolve', autospec=True, side_effect=lambda p, strict=False: p) as mock_resolve:
+            manager.add_target_tool(project, 'gradio')
+            manager.add_target_tool(project, 'streamlit')
+
+        assert mock_resolve.call_count == 1
+
+    def test_mutators_edit_stored_project_in_place(self, tmp_path):
+        """Test that add_* edits the cached project object instead of a copy."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        manager.add_target_tool(project, 'gradio')
+        stored = manager._mutable_project(project)
+
+        manager.add_installed_tool(project, 'crewai', {})
+
+        assert manager._mutable_project(project) is stored
+        assert list(stored['installed_tools']) == ['crewai']
+
+    def test_unchanged_content_not_rewritten(self, tmp_path):
+        """Test that saves differing only in last_updated skip the write."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        manager.set_user_preference('theme', 'dark')
+        manager.add_target_tool(project, 'gradio')
+
+        with patch.object(user_config, '_write_atomic') as mock_write:
+            manager.set_user_preference('theme', 'dark')
+            manager.add_target_tool(project, 'gradio')
+            mock_write.assert_not_called()
+
+            manager.set_user_preference('theme', 'light')
+            mock_write.assert_called_once()
+
+    def test_save_serializes_once(self, tmp_path):
+        """Test that a save dumps its content once and keeps the stamp on disk."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        manager.add_target_tool(project, 'gradio')
+
+        with patch.object(user_config, '_json_dumps', wraps=user_config._json_dumps) as mock_dumps:
+            manager.add_target_tool(project, 'streamlit')
+            content_dumps = [c for c in mock_dumps.call_args_list if isinstance(c.args[0], dict)]
+            assert len(content_dumps) == 1
+
+        stored = json.loads(manager._project_file(manager._key(project)).read_bytes())
+        assert 'last_updated' not in stored['config']
+        reloaded = UserConfigManager(tmp_path).get_project_config(project)
+        assert reloaded['last_updated'] == manager.get_project_config(project)['last_updated']
+        assert list(reloaded['target_tools']) == ['gradio', 'streamlit']
+
+    def test_get_save_round_trip_stays_serializable(self, tmp_path):
+        """Test that saving a config leaves the caller's copy as plain JSON data."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        manager.add_installed_tool(project, 'CrewAI', {})
+
+        config = manager.get_project_config(project)
+        manager.save_project_config(project, config)
+
+        assert config['installed_tools']['crewai']['name'] == 'crewai'
+        json.dumps(config)
+        assert manager.get_installed_tools(project)[0]['name'] == 'crewai'
+
+    def test_append_stamp(self):
+        """Test that the stamp is spliced into both empty and populated objects."""
+        for content in ({}, {'a': [1, 2]}):
+            data = user_config._append_stamp(user_config._json_dumps(content), 'now')
+            assert json.loads(data) == {**content, 'last_updated': 'now'}
+
+    def test_project_config_normalized_on_load(self, tmp_path):
+        """Test that missing or malformed container fields are filled in on load."""
+        manager = UserConfigManager(tmp_path)
+        project_key = str(tmp_path.resolve())
+        record = {'key': project_key, 'config': {'target_tools': None, 'scan_history': 'oops'}}
+        manager._project_file(project_key).write_text(json.dumps(record), encoding='utf-8')
+
+        config = manager.get_project_config(project_key)
+
+        for field, kind in user_config.PROJECT_CONTAINER_FIELDS.items():
+            assert config[field] == kind()
+        assert 'target_tools_count' not in config
+        assert manager.list_projects()[0]['target_tools_count'] == 0
+
+    @pytest.mark.skipif(not user_config.HAVE_ORJSON, reason="orjson not installed")
+    def test_prefetched_read(self, tmp_path):
+        """Test that files above the prefetch threshold parse identically."""
+        payload = {'history': ['x' * 1000] * 100}
+        path = tmp_path / 'huge.json'
+        path.write_bytes(user_config._json_dumps(payload))
+        assert path.stat().st_size >= user_config.PREFETCH_MIN_SIZE
+
+        assert user_config._read_json(path) == payload
+
+    def test_report_directory_created_once(self, tmp_path):
+        """Test that the report directory is only created once per location."""
+        manager = UserConfigManager(tmp_path / 'config')
+        manager.set_user_preference('report_directory', str(tmp_path / 'reports'))
+
+        with patch.object(user_config.Path, 'mkdir', autospec=True) as mock_mkdir:
+            manager.get_report_directory()
+            manager.get_report_directory()
+            assert mock_mkdir.call_count == 1
+
+            manager.set_user_preference('report_directory', str(tmp_path / 'other'))
+            assert manager.get_report_directory() == str(tmp_path / 'other')
+            assert mock_mkdir.call_count == 2
+
+    def test_get_user_config_is_shared(self, tmp_path, monkeypatch):
+        """Test that get_user_config returns one manager until the cache is cleared."""
+        monkeypatch.setattr(user_config, '_DEFAULT_CONFIG_DIR', tmp_path)
+        user_config.get_user_config.cache_clear()
+        try:
+            manager = user_config.get_user_config()
+            assert user_config.get_user_config() is manager
+            assert manager.config_dir == tmp_path
+        finally:
+            user_config.get_user_config.cache_clear()
+
+    def test_installed_tools_held_as_entries(self, tmp_path):
+        """Test that installed tools are ToolEntry objects in memory and dicts on disk."""
+        manager = UserConfigManager(tmp_path)
+        project = str(tmp_path)
+        manager.add_installed_tool(project, 'CrewAI', {'metadata': {'versions': ['0.1']}})
+
+        entry = manager._mutable_project(project)['installed_tools']['crewai']
+        assert isinstance(entry, user_config.ToolEntry)
+        assert manager.get_project_config(project)['installed_tools']['crewai'] == entry.to_dict()
+        json.dumps(manager.get_project_config(project))
+
+        with patch.object(user_config, 'HAVE_ORJSON', False):
+            stdlib_bytes = user_config._json_dumps(entry)
+        assert json.loads(stdlib_bytes) == json.loads(user_config._json_dumps(entry)) == entry.to_dict()
+
+        stored = json.loads(manager._project_file(manager._key(project)).read_text(encoding='utf-8'))
+        assert stored['config']['installed_tools']['crewai']['display_name'] == 'CrewAI'
+        assert UserConfigManager(tmp_path).get_installed_tools(project) == [entry.to_dict()]